@@ -4,6 +4,7 @@ Camera Controller Module
 Handles all camera operations and DepthAI pipeline management
 """
 
+import threading
 import depthai as dai
 import numpy as np
 import cv2
@@ -22,6 +23,11 @@ class CameraController:
         self.running = False
         # Cache of last retrieved frames per camera to avoid race conditions
         self.last_frames: Dict[str, np.ndarray] = {}
+        # Frames get_frame drained past but get_new_frames hasn't returned,
+        # kept only while set_keep_unread_frames(True) is in effect
+        self._keep_unread_frames = False
+        self._unread_frames: Dict[str, List[dai.ImgFrame]] = {}
+        self._unread_lock = threading.Lock()
         # Target output resolution per camera name (software-resized)
         # Defaults: CAM_A 1024x768, CAM_B/C 1280x800
         self.desired_resolutions: Dict[str, Tuple[int, int]] = {
@@ -142,14 +148,15 @@ class CameraController:
             queue = self.output_queues[camera_name]
             if queue.has():
                 try:
-                    frame = queue.get()
-                    img = frame.getCvFrame()
-                    # Apply software resize to desired resolution if configured
-                    target = self.desired_resolutions.get(camera_name)
-                    if target and img is not None:
-                        tgt_w, tgt_h = target
-                        if img.shape[1] != tgt_w or img.shape[0] != tgt_h:
-                            img = cv2.resize(img, (tgt_w, tgt_h), interpolation=cv2.INTER_AREA)
+                    # Drain any backlog and keep only the newest frame so the
+                    # display never falls behind the camera
+                    messages = queue.tryGetAll()
+                    if self._keep_unread_frames:
+                        with self._unread_lock:
+                            self._unread_frames.setdefault(camera_name, []).extend(
+                                messages
+                            )
+                    img = self._to_image(camera_name, messages[-1])
                     # Update last frame cache
                     if img is not None:
                         self.last_frames[camera_name] = img
@@ -161,6 +168,53 @@ class CameraController:
                 return self.last_frames[camera_name]
         return None
 
+    def get_new_frames(self, camera_name: str) -> List[np.ndarray]:
+        """Get every frame queued since the last read, oldest first
+
+        Unlike get_frame nothing is dropped, so a recording keeps the
+        camera's full frame rate. While set_keep_unread_frames(True) is in
+        effect this includes frames other get_frame callers drained.
+        Returns an empty list if nothing is new.
+        """
+        queue = self.output_queues.get(camera_name)
+        if queue is None:
+            return []
+        with self._unread_lock:
+            messages = self._unread_frames.pop(camera_name, [])
+        try:
+            if queue.has():
+                messages.extend(queue.tryGetAll())
+            images = [
+                img
+                for img in (self._to_image(camera_name, frame) for frame in messages)
+                if img is not None
+            ]
+        except Exception as e:
+            print(f"Frame retrieval error for {camera_name}: {e}")
+            return []
+        if images:
+            self.last_frames[camera_name] = images[-1]
+        return images
+
+    def set_keep_unread_frames(self, keep: bool):
+        """Hold frames drained by get_frame for the next get_new_frames call"""
+        if keep == self._keep_unread_frames:
+            return
+        self._keep_unread_frames = keep
+        if not keep:
+            with self._unread_lock:
+                self._unread_frames.clear()
+
+    def _to_image(self, camera_name: str, frame: dai.ImgFrame) -> Optional[np.ndarray]:
+        """Convert a queued frame, applying the software resize if configured"""
+        img = frame.getCvFrame()
+        target = self.desired_resolutions.get(camera_name)
+        if target and img is not None:
+            tgt_w, tgt_h = target
+            if img.shape[1] != tgt_w or img.shape[0] != tgt_h:
+                img = cv2.resize(img, (tgt_w, tgt_h), interpolation=cv2.INTER_AREA)
+        return img
+
     def set_desired_resolutions(self, per_camera: Dict[str, Tuple[int, int]]):
         """Set desired output resolution per camera (software resized)."""
         self.desired_resolutions.update(per_camera)
@@ -9,10 +9,13 @@ import depthai as dai
 import numpy as np
 import cv2
 from typing import Dict, Optional, Tuple, List, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import threading
 import time
 
+# Smallest ROI width/height (normalized), e.g. for a small mouse selection
+MIN_ROI_SIZE = 0.05
+
 
 @dataclass
 class ROISettings:
@@ -253,9 +256,8 @@ class ROIManager:
             norm_height = roi_height / frame_height
             
             # Ensure minimum size
-            min_size = 0.05  # 5% of frame
-            norm_width = max(norm_width, min_size)
-            norm_height = max(norm_height, min_size)
+            norm_width = max(norm_width, MIN_ROI_SIZE)
+            norm_height = max(norm_height, MIN_ROI_SIZE)
             
             print(f"Mouse ROI selection: raw=({roi_start_x},{roi_start_y})-({roi_end_x},{roi_end_y}), normalized=({norm_center_x:.3f},{norm_center_y:.3f}) size=({norm_width:.3f}x{norm_height:.3f})")
             
@@ -291,6 +293,24 @@ class ROIManager:
             if self.on_roi_updated:
                 self.on_roi_updated(camera_name, settings)
 
+    def apply_settings(self, camera_name: str, settings: ROISettings) -> bool:
+        """Apply several ROI changes as one update; returns False if nothing changed"""
+        current = self.roi_settings.get(camera_name)
+        if current is None:
+            return False
+        settings = replace(
+            settings,
+            x=max(0.0, min(1.0, settings.x)),
+            y=max(0.0, min(1.0, settings.y)),
+            width=max(MIN_ROI_SIZE, min(1.0, settings.width)),
+            height=max(MIN_ROI_SIZE, min(1.0, settings.height)),
+            exposure_compensation=max(-9, min(9, settings.exposure_compensation)),
+        )
+        if settings == current:
+            return False
+        self.set_roi_settings(camera_name, settings)
+        return True
+
     def get_roi_settings(self, camera_name: str) -> Optional[ROISettings]:
         """Get ROI settings for a specific camera"""
         return self.roi_settings.get(camera_name)
@@ -320,8 +340,8 @@ class ROIManager:
         """Set ROI size (normalized coordinates)"""
         if camera_name in self.roi_settings:
             old_width, old_height = self.roi_settings[camera_name].width, self.roi_settings[camera_name].height
-            self.roi_settings[camera_name].width = max(0.1, min(1.0, width))
-            self.roi_settings[camera_name].height = max(0.1, min(1.0, height))
+            self.roi_settings[camera_name].width = max(MIN_ROI_SIZE, min(1.0, width))
+            self.roi_settings[camera_name].height = max(MIN_ROI_SIZE, min(1.0, height))
             self.settings_changed[camera_name] = True
             print(f"ROI size changed for {camera_name}: ({old_width:.3f}x{old_height:.3f}) -> ({width:.3f}x{height:.3f})")
             if self.on_roi_updated:
@@ -1,5 +1,5 @@
 import depthai as dai
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
 
 
 class CameraSettingsManager:
@@ -23,6 +23,22 @@ class CameraSettingsManager:
     WB_MIN = 1000
     WB_MAX = 12000
 
+    # Camera control settings that are always reported as integers
+    INT_SETTINGS = frozenset(
+        [
+            "exposure",
+            "iso",
+            "focus",
+            "brightness",
+            "contrast",
+            "saturation",
+            "sharpness",
+            "white_balance",
+            "luma_denoise",
+            "chroma_denoise",
+        ]
+    )
+
     def __init__(self, camera_controller):
         self.camera_controller = camera_controller
 
@@ -227,7 +243,7 @@ class CameraSettingsManager:
         """Get setting value"""
         value = self.settings.get(key, 0)
         # Ensure integer values for camera controls
-        if key in ["exposure", "iso", "focus", "brightness", "contrast", "saturation", "sharpness", "white_balance", "luma_denoise", "chroma_denoise"]:
+        if key in self.INT_SETTINGS:
             return int(value) if value is not None else 0
         return value
 
@@ -248,6 +264,16 @@ class CameraSettingsManager:
         """Get all auto mode statuses"""
         return self.auto_modes.copy()
 
+    def get_settings_bulk(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several settings and auto modes in one call"""
+        result = {}
+        for key in keys:
+            if key in self.auto_modes:
+                result[key] = self.auto_modes[key]
+            else:
+                result[key] = self.get_setting(key)
+        return result
+
     def reset_to_defaults(self):
         """Reset all settings to default values"""
         self.settings.update(
@@ -304,7 +330,7 @@ class CameraSettingsManager:
         # Log current settings
         print("Current camera settings:")
         for key, value in self.settings.items():
-            if key in ["exposure", "iso", "focus", "brightness", "contrast", "saturation", "sharpness", "white_balance", "luma_denoise", "chroma_denoise"]:
+            if key in self.INT_SETTINGS:
                 print(f"  {key}: {value}")
         
         print("Auto modes:")
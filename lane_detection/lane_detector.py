@@ -346,7 +346,6 @@ class LaneDetector:
     def set_confidence_threshold(self, threshold: float):
         """Set confidence threshold for lane detection"""
         self.confidence_threshold = max(0.0, min(1.0, threshold))
-        print(f"Lane detection confidence threshold set to {self.confidence_threshold}")
     
     def set_detection_callback(self, callback: callable):
         """Set callback for detection results"""
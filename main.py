@@ -6,7 +6,8 @@ import time
 from datetime import datetime
 from pathlib import Path
 import cv2
-from typing import Dict, Optional
+from functools import partial
+from typing import Dict, List, Optional
 import subprocess
 import platform
 
@@ -182,38 +183,33 @@ class OAKCameraViewer:
                 # Update disk space info
                 free_gb, total_gb = self.file_manager.get_available_space()
                 if self.quick_actions:
-                    self.root.after(
-                        0,
-                        lambda: self.quick_actions.update_disk_space_display(
-                            free_gb, total_gb
-                        ),
+                    self.quick_actions.post_update(
+                        "update_disk_space_display", free_gb, total_gb
                     )
 
-                # Update recording duration
-                if self.file_manager.is_recording():
-                    duration = self.file_manager.get_recording_duration()
-                    if self.quick_actions:
-                        self.root.after(
-                            0,
-                            lambda: self.quick_actions.update_recording_status(
-                                True, duration
-                            ),
-                        )
-                    if self.ui_manager.get_status_bar():
-                        self.root.after(
-                            0,
-                            lambda: self.ui_manager.get_status_bar().update_status(
-                                f"Recording... {duration:.1f}s"
-                            ),
-                        )
+                # Update recording state every tick, not only while recording,
+                # so a stop that raced a queued duration update still lands
+                recording = self.file_manager.is_recording()
+                duration = (
+                    self.file_manager.get_recording_duration() if recording else 0.0
+                )
+                if self.quick_actions:
+                    self.quick_actions.post_update(
+                        "update_recording_status", recording, duration
+                    )
+                # Pass values as after() arguments so each callback shows
+                # this tick's reading, not whatever the loop holds later
+                status_bar = self.ui_manager.get_status_bar()
+                if recording and status_bar:
+                    self.root.after(
+                        0, status_bar.update_status, f"Recording... {duration:.1f}s"
+                    )
 
                 # Update FPS if connected
                 if self.connected and self.ui_manager.get_display_manager():
                     fps = self.ui_manager.get_display_manager().get_current_fps()
-                    if self.ui_manager.get_status_bar():
-                        self.root.after(
-                            0, lambda: self.ui_manager.get_status_bar().update_fps(fps)
-                        )
+                    if status_bar:
+                        self.root.after(0, status_bar.update_fps, fps)
 
                 time.sleep(1.0)
 
@@ -229,9 +225,11 @@ class OAKCameraViewer:
 
         self.update_status("Connecting to camera...")
         if self.quick_actions:
-            self.quick_actions.widgets["connection_status_label"].config(
-                text="● Connecting...", foreground="orange"
-            )
+            self.quick_actions.show_connecting()
+        # The connection thread reads the stream settings, so hold them
+        # still until it has finished
+        if self.control_panel:
+            self.control_panel.enable_controls(False)
 
         # Run connection in separate thread
         threading.Thread(target=self._connect_camera_thread, daemon=True).start()
@@ -374,6 +372,13 @@ class OAKCameraViewer:
                     else None
                 ),
             )
+        finally:
+            self.root.after(0, self._enable_camera_controls)
+
+    def _enable_camera_controls(self):
+        """Re-enable the camera settings panel after a connection attempt"""
+        if self.control_panel:
+            self.control_panel.enable_controls(True)
 
     def disconnect_camera(self):
         """Disconnect from camera"""
@@ -387,7 +392,7 @@ class OAKCameraViewer:
         if self.file_manager.is_recording():
             success, message, _ = self.file_manager.stop_video_recording()
             if self.quick_actions:
-                self.quick_actions.update_recording_status(False)
+                self.quick_actions.post_update("update_recording_status", False)
 
         # Stop ROI processing
         self.roi_manager.stop_roi_processing()
@@ -441,13 +446,20 @@ class OAKCameraViewer:
             self.update_status("Capture failed - no frames")
             return
 
-        # Capture batch
-        success_count, filepaths = self.file_manager.capture_images_batch(images)
+        # Write on the capture pool so the GUI stays responsive; the GPS fix
+        # is taken now so the sidecars describe the moment of capture
+        gps_data = self.gps.get_current_gps_data()
+        self.file_manager.capture_images_batch_async(
+            images, partial(self._on_images_captured, gps_data)
+        )
 
+    def _on_images_captured(
+        self, gps_data: Optional[Dict], success_count: int, filepaths: List[str]
+    ):
+        """Finish a capture on the capture thread and report it on the Tk thread"""
         if success_count > 0:
-            self.update_status(f"Captured {success_count} images")
+            message = f"Captured {success_count} images"
             # Save GPS data JSON alongside captures if available (same folder, same base)
-            gps_data = self.gps.get_current_gps_data()
             if gps_data:
                 for path in filepaths:
                     # Overwrite gps_integration default directory: save next to image
@@ -463,9 +475,10 @@ class OAKCameraViewer:
                             }, f, indent=2, ensure_ascii=False)
                     except Exception as e:
                         print(f"GPS save error: {e}")
-                self.update_status(f"Captured {success_count} images + GPS")
+                message = f"Captured {success_count} images + GPS"
         else:
-            self.update_status("Capture failed")
+            message = "Capture failed"
+        self.root.after(0, self.update_status, message)
 
     def _gps_distance_m(self, a: Dict, b: Dict) -> float:
         import math
@@ -556,7 +569,7 @@ class OAKCameraViewer:
             # Stop recording
             success, message, filepaths = self.file_manager.stop_video_recording()
             if self.quick_actions:
-                self.quick_actions.update_recording_status(False)
+                self.quick_actions.post_update("update_recording_status", False)
 
             if success:
                 self.update_status("Recording stopped")
@@ -584,7 +597,9 @@ class OAKCameraViewer:
 
             if success:
                 if self.quick_actions:
-                    self.quick_actions.update_recording_status(True, 0.0)
+                    self.quick_actions.post_update(
+                        "update_recording_status", True, 0.0
+                    )
                 self.update_status("Recording started")
                 # Note: For live GPS logging during recording, we could append per frame
                 # but for now we keep on-demand capture via button
@@ -650,7 +665,7 @@ class OAKCameraViewer:
         ):
             self.settings_manager.reset_to_defaults()
             if self.control_panel:
-                self.control_panel.update_all_widgets()
+                self.control_panel.update_all_widgets(force=True)
             self.update_status("Settings reset to defaults")
 
     def refresh_displays(self):
@@ -763,6 +778,10 @@ class OAKCameraViewer:
         # Cleanup
         if self.file_manager:
             self.file_manager.cleanup()
+        if self.quick_actions:
+            self.quick_actions.destroy()
+        if self.control_panel:
+            self.control_panel.destroy()
 
         self.root.quit()
         self.root.destroy()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for FileManager capture naming, video frame queueing and disk space caching
+"""
+
+import queue
+import shutil
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("numpy")
+
+from utils import file_manager as file_manager_module
+from utils.file_manager import FileManager
+
+
+class RecordingWriter:
+    """Stands in for cv2.VideoWriter, keeping what it was given"""
+
+    def __init__(self):
+        self.frames = []
+
+    def write(self, frame):
+        self.frames.append(frame)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = FileManager(tmp_path, worker_cores=set())
+    yield manager
+    if manager._capture_pool is not None:
+        manager._capture_pool.shutdown()
+
+
+def test_timestamp_suffixed_within_same_millisecond(manager):
+    now = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    first = manager._make_timestamp(now)
+    assert first == "20240501_123015_123"
+    assert manager._make_timestamp(now) == f"{first}_1"
+    assert manager._make_timestamp(now) == f"{first}_2"
+
+
+def test_timestamp_suffix_resets_on_next_millisecond(manager):
+    manager._make_timestamp(datetime(2024, 5, 1, 12, 30, 15, 123000))
+    manager._make_timestamp(datetime(2024, 5, 1, 12, 30, 15, 123999))
+    later = manager._make_timestamp(datetime(2024, 5, 1, 12, 30, 15, 124000))
+    assert later == "20240501_123015_124"
+
+
+def test_write_video_frame_drops_oldest_when_full(manager):
+    frames = queue.Queue(maxsize=2)
+    manager._frame_queues["CAM_A"] = frames
+    manager.recording = True
+
+    for frame in ("f1", "f2", "f3"):
+        assert manager.write_video_frame("CAM_A", frame)
+
+    assert [frames.get_nowait(), frames.get_nowait()] == ["f2", "f3"]
+    assert manager._dropped_frames["CAM_A"] == 1
+
+
+def test_write_video_frame_ignored_when_not_recording(manager):
+    manager._frame_queues["CAM_A"] = queue.Queue(maxsize=2)
+    assert not manager.write_video_frame("CAM_A", "f1")
+    assert not manager.write_video_frame("CAM_B", "f1")
+
+
+def test_writer_loop_stops_at_sentinel(manager):
+    frames = queue.Queue()
+    for item in ("f1", "f2", None, "after"):
+        frames.put(item)
+    writer = RecordingWriter()
+
+    manager._writer_loop("CAM_A", writer, frames)
+
+    assert writer.frames == ["f1", "f2"]
+    assert frames.get_nowait() == "after"
+
+
+def test_available_space_cached_within_ttl(manager, monkeypatch):
+    calls = []
+
+    def disk_usage(path):
+        calls.append(path)
+        return (100 * 1024**3, 40 * 1024**3, 60 * 1024**3)
+
+    clock = [1000.0]
+    monkeypatch.setattr(shutil, "disk_usage", disk_usage)
+    monkeypatch.setattr(file_manager_module.time, "monotonic", lambda: clock[0])
+
+    assert manager.get_available_space() == (60.0, 100.0)
+    clock[0] += FileManager._SPACE_CACHE_TTL / 2
+    assert manager.get_available_space() == (60.0, 100.0)
+    assert len(calls) == 1
+
+    clock[0] += FileManager._SPACE_CACHE_TTL
+    manager.get_available_space()
+    assert len(calls) == 2
+
+
+def test_available_space_cache_dropped_on_directory_change(
+    manager, tmp_path, monkeypatch
+):
+    calls = []
+
+    def disk_usage(path):
+        calls.append(path)
+        return (100 * 1024**3, 40 * 1024**3, 60 * 1024**3)
+
+    monkeypatch.setattr(shutil, "disk_usage", disk_usage)
+    manager.get_available_space()
+    manager.set_save_directory(tmp_path / "other")
+    manager.get_available_space()
+    assert calls == [tmp_path, tmp_path / "other"]
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for ROIManager.apply_settings clamping and change detection
+"""
+
+from dataclasses import replace
+
+import pytest
+
+pytest.importorskip("depthai")
+pytest.importorskip("cv2")
+
+from camera.roi_manager import MIN_ROI_SIZE, ROIManager, ROISettings
+
+
+@pytest.fixture
+def roi_manager():
+    manager = ROIManager(camera_controller=None)
+    manager.roi_settings["CAM_A"] = ROISettings()
+    return manager
+
+
+def test_apply_settings_clamps_out_of_range_values(roi_manager):
+    requested = ROISettings(
+        enabled=True, x=-0.5, y=1.5, width=0.0, height=2.0, exposure_compensation=20
+    )
+    assert roi_manager.apply_settings("CAM_A", requested)
+
+    applied = roi_manager.get_roi_settings("CAM_A")
+    assert (applied.x, applied.y) == (0.0, 1.0)
+    assert (applied.width, applied.height) == (MIN_ROI_SIZE, 1.0)
+    assert applied.exposure_compensation == 9
+
+
+def test_apply_settings_keeps_smallest_mouse_selection(roi_manager):
+    requested = replace(ROISettings(), width=MIN_ROI_SIZE, height=MIN_ROI_SIZE)
+    assert roi_manager.apply_settings("CAM_A", requested)
+    applied = roi_manager.get_roi_settings("CAM_A")
+    assert (applied.width, applied.height) == (MIN_ROI_SIZE, MIN_ROI_SIZE)
+
+
+def test_apply_settings_reports_no_change(roi_manager):
+    roi_manager.settings_changed["CAM_A"] = False
+    current = roi_manager.get_roi_settings("CAM_A")
+
+    assert not roi_manager.apply_settings("CAM_A", replace(current))
+    assert roi_manager.settings_changed["CAM_A"] is False
+
+
+def test_apply_settings_no_change_after_clamping(roi_manager):
+    roi_manager.apply_settings("CAM_A", replace(ROISettings(), exposure_compensation=9))
+    assert not roi_manager.apply_settings(
+        "CAM_A", replace(ROISettings(), exposure_compensation=15)
+    )
+
+
+def test_apply_settings_unknown_camera(roi_manager):
+    assert not roi_manager.apply_settings("CAM_B", ROISettings(enabled=True))
+    assert roi_manager.get_roi_settings("CAM_B") is None
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for CameraSettingsManager.get_settings_bulk
+"""
+
+import pytest
+
+pytest.importorskip("depthai")
+
+from camera.settings import CameraSettingsManager
+
+
+@pytest.fixture
+def settings_manager():
+    return CameraSettingsManager(camera_controller=None)
+
+
+def test_bulk_matches_individual_getters(settings_manager):
+    keys = ["exposure", "fps", "gps_interval_m", "auto_exposure", "auto_focus"]
+    snapshot = settings_manager.get_settings_bulk(keys)
+
+    assert list(snapshot) == keys
+    assert snapshot["exposure"] == settings_manager.get_setting("exposure")
+    assert snapshot["fps"] == settings_manager.get_setting("fps")
+    assert snapshot["gps_interval_m"] == settings_manager.get_setting("gps_interval_m")
+    assert snapshot["auto_exposure"] is settings_manager.get_auto_mode("auto_exposure")
+    assert snapshot["auto_focus"] is settings_manager.get_auto_mode("auto_focus")
+
+
+def test_bulk_coerces_camera_controls_to_int(settings_manager):
+    settings_manager.update_setting("exposure", 1500.7)
+    settings_manager.update_setting("gps_interval_m", 2.5)
+
+    snapshot = settings_manager.get_settings_bulk(["exposure", "gps_interval_m"])
+    assert snapshot == {"exposure": 1500, "gps_interval_m": 2.5}
+
+
+def test_bulk_reflects_later_updates(settings_manager):
+    settings_manager.update_setting("brightness", 3)
+    settings_manager.auto_modes["auto_white_balance"] = False
+
+    snapshot = settings_manager.get_settings_bulk(["brightness", "auto_white_balance"])
+    assert snapshot == {"brightness": 3, "auto_white_balance": False}
@@ -1,18 +1,83 @@
+import queue
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Dict, Any, Callable, Optional, TYPE_CHECKING
+from collections import OrderedDict
+from functools import partial
+from tkinter import ttk, messagebox, font as tkfont
+from typing import Dict, Any, Callable, List, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 
+from .tk_helpers import LabelTexts, run_once, suppress_events, unbind
+
 if TYPE_CHECKING:
     from camera.settings import CameraSettingsManager
 
+# Dropdown options shared by every ControlPanel instance
+_CAM_A_RESOLUTIONS = ("1024x768", "2048x1536", "4000x3000")
+_FPS_OPTIONS = ("5", "10", "15", "20", "25", "30", "45", "60")
+_ANTI_BANDING_OPTIONS = ("OFF", "50Hz", "60Hz", "AUTO")
+_EFFECT_OPTIONS = (
+    "OFF",
+    "MONO",
+    "NEGATIVE",
+    "SOLARIZE",
+    "SKETCH",
+    "WHITEBOARD",
+    "BLACKBOARD",
+)
+
+# Named fonts shared by every widget, created on first use (needs a Tk root)
+_FONTS: Dict[Tuple[int, str], tkfont.Font] = {}
+
+
+def _font(size: int, weight: str = "normal") -> tkfont.Font:
+    """Get the shared Arial font of the given size and weight"""
+    key = (size, weight)
+    if key not in _FONTS:
+        _FONTS[key] = tkfont.Font(family="Arial", size=size, weight=weight)
+    return _FONTS[key]
+
+
+@run_once
+def _configure_label_styles():
+    """Register the named label styles used by the control panels"""
+    style = ttk.Style()
+    style.configure("StatusBold.TLabel", font=_font(10, "bold"))
+    style.configure("Status.TLabel", font=_font(10))
+    style.configure("Info.TLabel", font=_font(9))
+
+
+def _clear_callbacks(owner: Any):
+    """Reset every on_* callback attribute so user callables can be released"""
+    for attr in list(vars(owner)):
+        if attr.startswith("on_"):
+            setattr(owner, attr, None)
+
 
 class QuickActionsMenu:
     """Handles the horizontal quick actions menu at the top"""
 
+    # How often updates posted from worker threads are applied
+    _UI_POLL_MS = 100
+
+    # Names accepted by set_callbacks (each maps to an on_<name> attribute)
+    _CALLBACK_NAMES = frozenset(
+        [
+            "connect",
+            "disconnect",
+            "capture",
+            "record_toggle",
+            "capture_gps",
+            "toggle_gps_interval",
+            "save_dir_change",
+            "update_settings",
+            "reset_settings",
+        ]
+    )
+
     def __init__(self, parent: tk.Widget):
         self.parent = parent
         self.widgets: Dict[str, Any] = {}
+        _configure_label_styles()
 
         # Callback functions
         self.on_connect: Optional[Callable] = None
@@ -25,13 +90,46 @@ class QuickActionsMenu:
         self.on_update_settings: Optional[Callable] = None
         self.on_reset_settings: Optional[Callable] = None
 
+        # Last recording state/duration shown, to skip redundant redraws
+        self._last_recording_state: Optional[bool] = None
+        self._last_duration_shown = -1
+        # Buttons are built in the disconnected state
+        self._last_connected = False
+        # Status labels, configured only when their text or colour changes
+        self._labels = LabelTexts(self.widgets)
+        self._last_save_dir: Optional[str] = None
+        # Latest disk space reading waiting for the idle-time flush
+        self._pending_disk: Tuple[float, float] = (0.0, 0.0)
+        self._disk_after_id: Optional[str] = None
+
+        # Polled status updates received while the window is minimised are
+        # held here (method name -> args) and applied once it is shown again
+        self._visible = True
+        self._deferred_updates: Dict[str, Tuple] = {}
+        self._toplevel = parent.winfo_toplevel()
+        self._toplevel_bindings = {
+            "<Unmap>": self._toplevel.bind(
+                "<Unmap>", self._on_toplevel_unmap, add="+"
+            ),
+            "<Map>": self._toplevel.bind("<Map>", self._on_toplevel_map, add="+"),
+        }
+
+        # Status updates posted from worker threads, applied on the Tk thread
+        self._ui_queue: "queue.Queue[Tuple[str, Tuple]]" = queue.Queue()
+
         self.setup_quick_actions()
+        self._drain_after_id: Optional[str] = self.parent.after(
+            self._UI_POLL_MS, self._drain_ui_queue
+        )
 
     def setup_quick_actions(self):
         """Setup the horizontal quick actions menu"""
         # Main action frame with better styling
         action_frame = ttk.LabelFrame(self.parent, text="Quick Actions", padding=10)
+        self._action_frame = action_frame
         action_frame.pack(fill=tk.X, pady=(0, 10))
+        # Size the menu once after all rows are added, not per pack call
+        action_frame.pack_propagate(False)
 
         # Top row - Main action buttons
         button_row = ttk.Frame(action_frame)
@@ -54,8 +152,11 @@ class QuickActionsMenu:
             text="🔌 Disconnect",
             command=self._on_disconnect_clicked,
             width=12,
+            state="disabled",
         )
         self.widgets["disconnect_btn"].pack(side=tk.LEFT, padx=2)
+        self._connect_btn = self.widgets["connect_btn"]
+        self._disconnect_btn = self.widgets["disconnect_btn"]
 
         # Capture buttons
         capture_frame = ttk.LabelFrame(button_row, text="Capture", padding=5)
@@ -76,6 +177,7 @@ class QuickActionsMenu:
             width=15,
         )
         self.widgets["record_btn"].pack(side=tk.LEFT, padx=2)
+        self._record_btn = self.widgets["record_btn"]
 
         # GPS capture button
         self.widgets["gps_btn"] = ttk.Button(
@@ -126,38 +228,65 @@ class QuickActionsMenu:
         # Status row - Information display
         status_row = ttk.Frame(action_frame)
         status_row.pack(fill=tk.X, pady=(5, 0))
+        # Left-hand labels, a stretching gap, then right-hand labels
+        status_row.columnconfigure(2, weight=1)
 
         # Connection status
         self.widgets["connection_status_label"] = ttk.Label(
             status_row,
             text="● Disconnected",
             foreground="red",
-            font=("Arial", 10, "bold"),
+            style="StatusBold.TLabel",
         )
-        self.widgets["connection_status_label"].pack(side=tk.LEFT)
+        self.widgets["connection_status_label"].grid(row=0, column=0, sticky=tk.W)
 
         # Recording status
         self.widgets["recording_status_label"] = ttk.Label(
-            status_row, text="", foreground="green", font=("Arial", 10)
+            status_row, text="", foreground="green", style="Status.TLabel"
+        )
+        self.widgets["recording_status_label"].grid(
+            row=0, column=1, sticky=tk.W, padx=(20, 0)
         )
-        self.widgets["recording_status_label"].pack(side=tk.LEFT, padx=(20, 0))
 
         # Save directory display
         self.widgets["save_dir_label"] = ttk.Label(
-            status_row, text="📁 ./captures", font=("Arial", 9), foreground="blue"
+            status_row,
+            text="📁 ./captures",
+            style="Info.TLabel",
+            foreground="blue",
         )
-        self.widgets["save_dir_label"].pack(side=tk.RIGHT)
+        self.widgets["save_dir_label"].grid(row=0, column=4, sticky=tk.E)
 
         # Disk space info
         self.widgets["disk_space_label"] = ttk.Label(
-            status_row, text="", font=("Arial", 9), foreground="gray"
+            status_row, text="", style="Info.TLabel", foreground="gray"
+        )
+        self.widgets["disk_space_label"].grid(
+            row=0, column=3, sticky=tk.E, padx=(0, 20)
         )
-        self.widgets["disk_space_label"].pack(side=tk.RIGHT, padx=(0, 20))
+
+        action_frame.pack_propagate(True)
+        action_frame.update_idletasks()
+
+    def destroy(self):
+        """Destroy the menu's widgets and drop every Tcl-side reference to it"""
+        for after_id in (self._drain_after_id, self._disk_after_id):
+            if after_id is not None:
+                self.parent.after_cancel(after_id)
+        self._drain_after_id = self._disk_after_id = None
+
+        for sequence, funcid in self._toplevel_bindings.items():
+            unbind(self._toplevel, sequence, funcid)
+        self._toplevel_bindings.clear()
+
+        self._action_frame.destroy()
+        self.widgets.clear()
+        _clear_callbacks(self)
 
     def set_callbacks(self, **callbacks):
         """Set callback functions for various events"""
         for name, callback in callbacks.items():
-            if hasattr(self, f"on_{name}"):
+            if name in self._CALLBACK_NAMES:
                 setattr(self, f"on_{name}", callback)
 
     # Event handlers
@@ -188,9 +317,9 @@ class QuickActionsMenu:
     def update_gps_interval_status(self, running: bool):
         """Update GPS interval capture toggle button text"""
         if running:
-            self.widgets["gps_interval_btn"].config(text="⏹ Stop GPS Capture")
+            self._labels.set("gps_interval_btn", "⏹ Stop GPS Capture")
         else:
-            self.widgets["gps_interval_btn"].config(text="▶ Start GPS Capture")
+            self._labels.set("gps_interval_btn", "▶ Start GPS Capture")
 
     def _on_save_dir_clicked(self):
         if self.on_save_dir_change:
@@ -208,65 +337,284 @@ class QuickActionsMenu:
     def update_connection_status(self, connected: bool):
         """Update connection status display"""
         if connected:
-            self.widgets["connection_status_label"].config(
-                text="● Connected", foreground="green"
-            )
-            self.widgets["connect_btn"].config(state="disabled")
-            self.widgets["disconnect_btn"].config(state="normal")
+            self._labels.set("connection_status_label", "● Connected", "green")
         else:
-            self.widgets["connection_status_label"].config(
-                text="● Disconnected", foreground="red"
-            )
-            self.widgets["connect_btn"].config(state="normal")
-            self.widgets["disconnect_btn"].config(state="disabled")
+            self._labels.set("connection_status_label", "● Disconnected", "red")
+        if connected != self._last_connected:
+            self._connect_btn.config(state="disabled" if connected else "normal")
+            self._disconnect_btn.config(state="normal" if connected else "disabled")
+            self._last_connected = connected
+
+    def show_connecting(self):
+        """Show that a connection attempt is in progress"""
+        self._labels.set("connection_status_label", "● Connecting...", "orange")
+
+    def post_update(self, name: str, *args):
+        """Queue a call to an update_* method from any thread"""
+        self._ui_queue.put((name, args))
+
+    def _drain_ui_queue(self):
+        """Apply queued status updates, keeping only the newest per method"""
+        latest: Dict[str, Tuple] = {}
+        while True:
+            try:
+                name, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            latest[name] = args
+        for name, args in latest.items():
+            getattr(self, name)(*args)
+        self._drain_after_id = self.parent.after(
+            self._UI_POLL_MS, self._drain_ui_queue
+        )
+
+    def _on_toplevel_unmap(self, event):
+        # Children's <Map>/<Unmap> also reach the toplevel binding; only
+        # react to the window itself being hidden or shown. event.widget can
+        # be a plain string for windows tkinter doesn't know (e.g. the menubar
+        # clone), so compare against the saved toplevel
+        if event.widget is self._toplevel:
+            self._visible = False
+
+    def _on_toplevel_map(self, event):
+        if event.widget is not self._toplevel:
+            return
+        self._visible = True
+        deferred, self._deferred_updates = self._deferred_updates, {}
+        for name, args in deferred.items():
+            getattr(self, name)(*args)
 
     def update_recording_status(self, recording: bool, duration: float = 0.0):
         """Update recording status display"""
+        if not self._visible:
+            self._deferred_updates["update_recording_status"] = (recording, duration)
+            return
+        # The label only shows whole seconds, so skip calls that wouldn't change it
+        whole_seconds = int(duration) if recording else -1
+        if (
+            recording == self._last_recording_state
+            and whole_seconds == self._last_duration_shown
+        ):
+            return
+
+        if recording != self._last_recording_state:
+            self._record_btn.config(
+                text="⏹️ Stop Recording" if recording else "🎥 Start Recording"
+            )
+            self._last_recording_state = recording
+
         if recording:
-            self.widgets["record_btn"].config(text="⏹️ Stop Recording")
-            minutes = int(duration // 60)
-            seconds = int(duration % 60)
+            minutes, seconds = divmod(whole_seconds, 60)
             status_text = f"🔴 Recording {minutes:02d}:{seconds:02d}"
-            self.widgets["recording_status_label"].config(
-                text=status_text, foreground="red"
-            )
+            self._labels.set("recording_status_label", status_text, "red")
         else:
-            self.widgets["record_btn"].config(text="🎥 Start Recording")
-            self.widgets["recording_status_label"].config(text="")
+            self._labels.set("recording_status_label", "")
+        self._last_duration_shown = whole_seconds
 
     def update_save_directory_display(self, directory: Path):
         """Update save directory display"""
         dir_str = str(directory)
+        if dir_str == self._last_save_dir:
+            return
+        self._last_save_dir = dir_str
         if len(dir_str) > 30:
             dir_str = "..." + dir_str[-27:]
-        self.widgets["save_dir_label"].config(text=f"📁 {dir_str}")
+        self._labels.set("save_dir_label", f"📁 {dir_str}")
 
     def update_disk_space_display(self, free_gb: float, total_gb: float):
         """Update disk space display"""
+        if not self._visible:
+            self._deferred_updates["update_disk_space_display"] = (free_gb, total_gb)
+            return
+        # Bursts of calls collapse into one label update at idle time
+        self._pending_disk = (free_gb, total_gb)
+        if self._disk_after_id is None:
+            self._disk_after_id = self.parent.after_idle(self._flush_disk_space)
+
+    def _flush_disk_space(self):
+        """Show the most recent disk space reading"""
+        self._disk_after_id = None
+        free_gb, total_gb = self._pending_disk
         percentage = (free_gb / total_gb) * 100 if total_gb > 0 else 0
-        self.widgets["disk_space_label"].config(
-            text=f"💾 {free_gb:.1f}GB free ({percentage:.0f}%)"
+        self._labels.set(
+            "disk_space_label", f"💾 {free_gb:.1f}GB free ({percentage:.0f}%)"
         )
 
 
 class ControlPanel:
     """Manages the camera control UI panel (without actions - they're now in QuickActionsMenu)"""
 
+    # Maximum number of resolution entries shown in the dropdown
+    _MAX_DROPDOWN = 20
+
+    # Slider values are written at most once per this many milliseconds
+    _SLIDER_DEBOUNCE_MS = 50
+
+    # Checkbox widget key -> settings manager auto mode key
+    _AUTO_MODE_KEYS = {
+        "auto_exposure": "auto_exposure",
+        "auto_focus": "auto_focus",
+        "auto_wb": "auto_white_balance",
+        "ae_lock": "auto_exposure_lock",
+        "awb_lock": "auto_white_balance_lock",
+    }
+    _MANUAL_KEYS = (
+        "exposure",
+        "iso",
+        "focus",
+        "brightness",
+        "contrast",
+        "saturation",
+        "sharpness",
+        "white_balance",
+        "luma_denoise",
+        "chroma_denoise",
+    )
+    # Everything update_all_widgets reads, fetched in one call
+    _REFRESH_KEYS = (
+        tuple(_AUTO_MODE_KEYS.values())
+        + _MANUAL_KEYS
+        + ("resolution_width", "resolution_height", "fps")
+    )
+
+    # Names accepted by set_callbacks (each maps to an on_<name> attribute)
+    _CALLBACK_NAMES = frozenset(["settings_change"])
+
+    # Settings tab layouts: (section title, "checks" | "sliders", [(label, key)])
+    _AUTO_MANUAL_SECTIONS = (
+        (
+            "Automatic Controls",
+            "checks",
+            (
+                ("Auto Exposure", "auto_exposure"),
+                ("Auto Focus", "auto_focus"),
+                ("Auto White Balance", "auto_wb"),
+            ),
+        ),
+        (
+            "Lock Controls",
+            "checks",
+            (
+                ("Auto Exposure Lock", "ae_lock"),
+                ("Auto White Balance Lock", "awb_lock"),
+            ),
+        ),
+        (
+            "Manual Controls",
+            "sliders",
+            (
+                ("Exposure (μs):", "exposure"),
+                ("ISO:", "iso"),
+                ("Focus:", "focus"),
+            ),
+        ),
+    )
+    _IMAGE_QUALITY_SECTIONS = (
+        (
+            "Color Adjustments",
+            "sliders",
+            (
+                ("Brightness:", "brightness"),
+                ("Contrast:", "contrast"),
+                ("Saturation:", "saturation"),
+                ("White Balance (K):", "white_balance"),
+            ),
+        ),
+        ("Image Enhancement", "sliders", (("Sharpness:", "sharpness"),)),
+    )
+    _ADVANCED_SECTIONS = (
+        (
+            "Noise Reduction",
+            "sliders",
+            (
+                ("Luma Denoise:", "luma_denoise"),
+                ("Chroma Denoise:", "chroma_denoise"),
+            ),
+        ),
+    )
+
+    # Toggle widget key -> settings manager setter
+    _SETTER = {
+        "auto_exposure": "set_auto_exposure",
+        "auto_focus": "set_auto_focus",
+        "auto_wb": "set_auto_white_balance",
+        "ae_lock": "set_auto_exposure_lock",
+        "awb_lock": "set_auto_white_balance_lock",
+    }
+
     def __init__(self, parent: tk.Widget, settings_manager: "CameraSettingsManager"):
         self.parent = parent
         self.settings_manager = settings_manager
         self.widgets: Dict[str, Any] = {}
+        _configure_label_styles()
+
+        # Set while widgets are refreshed programmatically so that the
+        # change handlers don't push values back into the settings manager
+        self._suppress_events = False
+        # Last value pushed to the settings manager per key
+        self._last_values: Dict[str, Any] = {}
+        # Hash of the settings snapshot last applied by update_all_widgets
+        self._last_snapshot_key: Optional[int] = None
+        # The snapshot itself, to tell which settings a later one changed
+        self._last_snapshot: Dict[str, Any] = {}
+        # Pending after_idle id for a scheduled update_all_widgets pass
+        self._bulk_update_id: Optional[str] = None
+        # Pending debounced slider writes per setting key
+        self._pending_after: Dict[str, str] = {}
+        # Interactive widgets affected by enable_controls
+        self._toggleable: List[ttk.Widget] = []
+        self._controls_enabled = True
+        # Slider (min, max) per setting key, read once from the settings manager
+        self._ranges: Dict[str, Tuple[int, int]] = {
+            key: (
+                getattr(settings_manager, f"{prefix}_MIN"),
+                getattr(settings_manager, f"{prefix}_MAX"),
+            )
+            for key, prefix in (
+                ("exposure", "EXPOSURE"),
+                ("iso", "ISO"),
+                ("focus", "FOCUS"),
+                ("brightness", "BRIGHTNESS"),
+                ("contrast", "CONTRAST"),
+                ("saturation", "SATURATION"),
+                ("white_balance", "WB"),
+                ("sharpness", "SHARPNESS"),
+            )
+        }
+        self._ranges["luma_denoise"] = (0, 4)
+        self._ranges["chroma_denoise"] = (0, 4)
 
         # Callback functions (for settings only)
         self.on_settings_change: Optional[Callable] = None
 
+        self._controls_built = False
+        self._sections: List[tk.Widget] = []
+        # Custom resolution dialog, built on first use and then reused
+        self._custom_res_dialog: Optional[tk.Toplevel] = None
+        self._custom_res_vars: Tuple[tk.IntVar, ...] = ()
         self.setup_controls()
 
     def setup_controls(self):
         """Setup all control widgets (without action buttons)"""
-        self._setup_connection_info()
-        self._setup_resolution_controls()
-        self._setup_camera_settings_tabs()
+        if self._controls_built:
+            # Widgets already exist; refresh their values instead of
+            # stacking a second copy of the panel into the parent
+            self.update_all_widgets()
+            return
+        self._controls_built = True
+        existing = set(self.parent.winfo_children())
+        # Hold the parent's size while the sections are packed so geometry
+        # is negotiated once at the end rather than after every section
+        self.parent.pack_propagate(False)
+        try:
+            self._setup_connection_info()
+            self._setup_resolution_controls()
+            self._setup_camera_settings_tabs()
+        finally:
+            self.parent.pack_propagate(True)
+        # Top-level sections owned by this panel, for destroy()
+        self._sections = [w for w in self.parent.winfo_children() if w not in existing]
+        self.parent.update_idletasks()
 
     def _setup_connection_info(self):
         """Setup device information display"""
@@ -274,7 +622,10 @@ class ControlPanel:
         info_frame.pack(fill=tk.X, pady=(0, 10))
 
         self.widgets["device_info_label"] = ttk.Label(
-            info_frame, text="No device connected", font=("Arial", 9), justify=tk.LEFT
+            info_frame,
+            text="No device connected",
+            style="Info.TLabel",
+            justify=tk.LEFT,
         )
         self.widgets["device_info_label"].pack(anchor=tk.W)
 
@@ -289,27 +640,31 @@ class ControlPanel:
 
         ttk.Label(cam_a_section, text="CAM_A Resolution:", width=18).pack(side=tk.LEFT)
 
-        # Allowed CAM_A resolutions
-        self.cam_a_resolution_options = [
-            "1024x768",
-            "2048x1536",
-            "4000x3000",
-        ]
+        # Allowed CAM_A resolutions, ordered and unique, mapped to their parsed
+        # (width, height) so applying a selection needs no string parsing
+        self.cam_a_resolution_options: "OrderedDict[str, Tuple[int, int]]" = (
+            OrderedDict(
+                (res, self._parse_resolution(res)) for res in _CAM_A_RESOLUTIONS
+            )
+        )
 
         # Default CAM_A resolution
         cam_a_default = "1024x768"
-        if cam_a_default not in self.cam_a_resolution_options:
-            self.cam_a_resolution_options.append(cam_a_default)
+        self.cam_a_resolution_options.setdefault(cam_a_default, (1024, 768))
 
         self.widgets["cam_a_resolution_var"] = tk.StringVar(value=cam_a_default)
-        cam_a_dropdown = ttk.Combobox(
+        self.widgets["cam_a_resolution_dropdown"] = ttk.Combobox(
             cam_a_section,
             textvariable=self.widgets["cam_a_resolution_var"],
-            values=self.cam_a_resolution_options,
+            values=self._resolution_dropdown_values(),
             state="readonly",
             width=14,
         )
-        cam_a_dropdown.pack(side=tk.LEFT, padx=5)
+        self._register_toggleable(self.widgets["cam_a_resolution_dropdown"])
+        self.widgets["cam_a_resolution_dropdown"].bind(
+            "<<ComboboxSelected>>", self._invalidate_snapshot
+        )
+        self.widgets["cam_a_resolution_dropdown"].pack(side=tk.LEFT, padx=5)
 
         # CAM_B/C Resolution display (fixed)
         cam_bc_section = ttk.Frame(res_frame)
@@ -323,10 +678,10 @@ class ControlPanel:
 
         ttk.Label(fps_section, text="FPS:", width=12).pack(side=tk.LEFT)
 
-        fps_options = ["5", "10", "15", "20", "25", "30", "45", "60"]
         current_fps = str(self.settings_manager.get_setting("fps"))
+        fps_options = _FPS_OPTIONS
         if current_fps not in fps_options:
-            fps_options.append(current_fps)
+            fps_options += (current_fps,)
 
         self.widgets["fps_var"] = tk.StringVar(value=current_fps)
         fps_dropdown = ttk.Combobox(
@@ -336,6 +691,8 @@ class ControlPanel:
             state="readonly",
             width=8,
         )
+        self._register_toggleable(fps_dropdown)
+        fps_dropdown.bind("<<ComboboxSelected>>", self._invalidate_snapshot)
         fps_dropdown.pack(side=tk.LEFT, padx=5)
 
         # Apply button
@@ -345,17 +702,49 @@ class ControlPanel:
             command=self._on_apply_stream_settings,
             width=15,
         )
+        self._register_toggleable(apply_btn)
         apply_btn.pack(side=tk.RIGHT)
 
+    def _resolution_dropdown_values(self) -> list:
+        """Get the most recent resolution entries to show in the dropdown"""
+        return list(self.cam_a_resolution_options)[-self._MAX_DROPDOWN:]
+
+    def _add_resolution_option(self, width: int, height: int) -> str:
+        """Add a resolution option and refresh the dropdown if it is new"""
+        resolution = f"{width}x{height}"
+        if resolution in self.cam_a_resolution_options:
+            return resolution
+        self.cam_a_resolution_options[resolution] = (width, height)
+        self.widgets["cam_a_resolution_dropdown"].configure(
+            values=self._resolution_dropdown_values()
+        )
+        return resolution
+
     def _show_custom_resolution_dialog(self):
         """Show dialog for custom resolution input"""
+        if self._custom_res_dialog is None:
+            self._build_custom_resolution_dialog()
+        else:
+            self._custom_res_dialog.deiconify()
+
+        # Start from the current settings each time the dialog is shown
+        self._custom_res_vars[0].set(
+            self.settings_manager.get_setting("resolution_width")
+        )
+        self._custom_res_vars[1].set(
+            self.settings_manager.get_setting("resolution_height")
+        )
+        self._custom_res_dialog.grab_set()
+
+    def _build_custom_resolution_dialog(self):
+        """Create the custom resolution dialog (kept and reused once built)"""
         dialog = tk.Toplevel(self.parent)
         dialog.title("Custom Resolution")
         dialog.geometry("300x150")
         dialog.resizable(False, False)
-        dialog.grab_set()
-
         dialog.transient(self.parent.winfo_toplevel())
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_custom_resolution_dialog)
+        self._custom_res_dialog = dialog
 
         ttk.Label(dialog, text="Enter custom resolution:").pack(pady=10)
 
@@ -363,42 +752,46 @@ class ControlPanel:
         frame.pack(pady=5)
 
         ttk.Label(frame, text="Width:").grid(row=0, column=0, padx=5)
-        width_var = tk.IntVar(
-            value=self.settings_manager.get_setting("resolution_width")
-        )
+        width_var = tk.IntVar()
         width_entry = ttk.Entry(frame, textvariable=width_var, width=8)
         width_entry.grid(row=0, column=1, padx=5)
 
         ttk.Label(frame, text="Height:").grid(row=0, column=2, padx=5)
-        height_var = tk.IntVar(
-            value=self.settings_manager.get_setting("resolution_height")
-        )
+        height_var = tk.IntVar()
         height_entry = ttk.Entry(frame, textvariable=height_var, width=8)
         height_entry.grid(row=0, column=3, padx=5)
+        self._custom_res_vars = (width_var, height_var)
 
         button_frame = ttk.Frame(dialog)
         button_frame.pack(pady=20)
 
-        def apply_custom():
-            width = width_var.get()
-            height = height_var.get()
-            if width > 0 and height > 0:
-                custom_res = f"{width}x{height}"
-                if custom_res not in self.resolution_options:
-                    self.resolution_options.append(custom_res)
-                self.widgets["resolution_var"].set(custom_res)
-                dialog.destroy()
-            else:
-                messagebox.showerror(
-                    "Invalid Resolution", "Please enter valid width and height values"
-                )
+        ttk.Button(
+            button_frame, text="Apply", command=self._apply_custom_resolution
+        ).pack(side=tk.LEFT, padx=5)
+        ttk.Button(
+            button_frame, text="Cancel", command=self._hide_custom_resolution_dialog
+        ).pack(side=tk.LEFT, padx=5)
 
-        ttk.Button(button_frame, text="Apply", command=apply_custom).pack(
-            side=tk.LEFT, padx=5
-        )
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(
-            side=tk.LEFT, padx=5
-        )
+    def _apply_custom_resolution(self):
+        """Add the entered resolution to the dropdown and select it"""
+        try:
+            width, height = (var.get() for var in self._custom_res_vars)
+        except tk.TclError:
+            width = height = 0
+        if width > 0 and height > 0:
+            custom_res = self._add_resolution_option(width, height)
+            self.widgets["cam_a_resolution_var"].set(custom_res)
+            self._invalidate_snapshot()
+            self._hide_custom_resolution_dialog()
+        else:
+            messagebox.showerror(
+                "Invalid Resolution", "Please enter valid width and height values"
+            )
+
+    def _hide_custom_resolution_dialog(self):
+        """Hide the custom resolution dialog until it is needed again"""
+        self._custom_res_dialog.grab_release()
+        self._custom_res_dialog.withdraw()
 
     def _setup_camera_settings_tabs(self):
         """Setup camera settings in tabbed interface"""
@@ -414,260 +807,94 @@ class ControlPanel:
         self.settings_notebook.add(auto_frame, text="Auto/Manual")
         self._setup_auto_manual_tab(auto_frame)
 
-        # Tab 2: Image Quality
+        # Tab 2: Image Quality (built on first selection)
         quality_frame = ttk.Frame(self.settings_notebook)
         self.settings_notebook.add(quality_frame, text="Image Quality")
-        self._setup_image_quality_tab(quality_frame)
 
-        # Tab 3: Advanced Settings
+        # Tab 3: Advanced Settings (built on first selection)
         advanced_frame = ttk.Frame(self.settings_notebook)
         self.settings_notebook.add(advanced_frame, text="Advanced")
-        self._setup_advanced_tab(advanced_frame)
 
-    def _setup_auto_manual_tab(self, parent):
-        """Setup auto/manual controls tab"""
-        # Create scrollable frame
-        canvas = tk.Canvas(parent)
+        # Tab index -> (frame, builder) for tabs that haven't been built yet
+        self._tab_builders = {
+            1: (quality_frame, self._setup_image_quality_tab),
+            2: (advanced_frame, self._setup_advanced_tab),
+        }
+        self._built_tabs = {0}
+        self.settings_notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event=None):
+        """Build a settings tab the first time it is selected"""
+        index = self.settings_notebook.index("current")
+        if index in self._built_tabs or index not in self._tab_builders:
+            return
+        frame, builder = self._tab_builders[index]
+        builder(frame)
+        self._built_tabs.add(index)
+
+    def _create_tab_body(self, parent):
+        """Create the scrollable content frame for a settings tab"""
+        canvas = tk.Canvas(parent, highlightthickness=0)
         scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        body = ttk.Frame(canvas)
+
+        # The body only resizes when its rows do, so its own <Configure> is
+        # the one place the scrollregion needs updating; the event already
+        # carries the new size, so no bbox query is needed
+        body.bind(
+            "<Configure>",
+            lambda event: canvas.configure(
+                scrollregion=(0, 0, event.width, event.height)
+            ),
         )
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.create_window((0, 0), window=body, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
-        # Auto Controls Section
-        auto_section = ttk.LabelFrame(
-            scrollable_frame, text="Automatic Controls", padding=5
-        )
-        auto_section.pack(fill=tk.X, pady=(0, 10))
-
-        # Auto Exposure
-        self.widgets["auto_exposure"] = tk.BooleanVar(
-            value=self.settings_manager.get_auto_mode("auto_exposure")
-        )
-        auto_exp_check = ttk.Checkbutton(
-            auto_section,
-            text="Auto Exposure",
-            variable=self.widgets["auto_exposure"],
-            command=self._on_auto_exposure_changed,
-        )
-        auto_exp_check.pack(anchor=tk.W, pady=2)
-
-        # Auto Focus
-        self.widgets["auto_focus"] = tk.BooleanVar(
-            value=self.settings_manager.get_auto_mode("auto_focus")
-        )
-        auto_focus_check = ttk.Checkbutton(
-            auto_section,
-            text="Auto Focus",
-            variable=self.widgets["auto_focus"],
-            command=self._on_auto_focus_changed,
-        )
-        auto_focus_check.pack(anchor=tk.W, pady=2)
-
-        # Auto White Balance
-        self.widgets["auto_wb"] = tk.BooleanVar(
-            value=self.settings_manager.get_auto_mode("auto_white_balance")
-        )
-        auto_wb_check = ttk.Checkbutton(
-            auto_section,
-            text="Auto White Balance",
-            variable=self.widgets["auto_wb"],
-            command=self._on_auto_wb_changed,
-        )
-        auto_wb_check.pack(anchor=tk.W, pady=2)
-
-        # Lock Controls Section
-        lock_section = ttk.LabelFrame(scrollable_frame, text="Lock Controls", padding=5)
-        lock_section.pack(fill=tk.X, pady=(0, 10))
-
-        self.widgets["ae_lock"] = tk.BooleanVar()
-        ttk.Checkbutton(
-            lock_section,
-            text="Auto Exposure Lock",
-            variable=self.widgets["ae_lock"],
-            command=self._on_ae_lock_changed,
-        ).pack(anchor=tk.W, pady=2)
-
-        self.widgets["awb_lock"] = tk.BooleanVar()
-        ttk.Checkbutton(
-            lock_section,
-            text="Auto White Balance Lock",
-            variable=self.widgets["awb_lock"],
-            command=self._on_awb_lock_changed,
-        ).pack(anchor=tk.W, pady=2)
-
-        # Manual Controls Section
-        manual_section = ttk.LabelFrame(
-            scrollable_frame, text="Manual Controls", padding=5
-        )
-        manual_section.pack(fill=tk.X, pady=(0, 10))
-
-        self._setup_manual_controls_in_frame(
-            manual_section,
-            [
-                (
-                    "Exposure (μs):",
-                    "exposure",
-                    self.settings_manager.EXPOSURE_MIN,
-                    self.settings_manager.EXPOSURE_MAX,
-                    self._on_exposure_changed,
-                ),
-                (
-                    "ISO:",
-                    "iso",
-                    self.settings_manager.ISO_MIN,
-                    self.settings_manager.ISO_MAX,
-                    self._on_iso_changed,
-                ),
-                (
-                    "Focus:",
-                    "focus",
-                    self.settings_manager.FOCUS_MIN,
-                    self.settings_manager.FOCUS_MAX,
-                    self._on_focus_changed,
-                ),
-            ],
-        )
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        return body
+
+    def _setup_sections(self, body, sections):
+        """Build a tab's (title, kind, items) sections into its body"""
+        builders = {
+            "checks": self._setup_checkbuttons_in_frame,
+            "sliders": self._setup_manual_controls_in_frame,
+        }
+        for title, kind, items in sections:
+            section = ttk.LabelFrame(body, text=title, padding=5)
+            section.pack(fill=tk.X, pady=(0, 10))
+            builders[kind](section, items)
+
+    def _setup_auto_manual_tab(self, parent):
+        """Setup auto/manual controls tab"""
+        body = self._create_tab_body(parent)
+        self._setup_sections(body, self._AUTO_MANUAL_SECTIONS)
 
         # Trigger Controls Section
-        trigger_section = ttk.LabelFrame(
-            scrollable_frame, text="Trigger Controls", padding=5
-        )
+        trigger_section = ttk.LabelFrame(body, text="Trigger Controls", padding=5)
         trigger_section.pack(fill=tk.X)
 
-        ttk.Button(
-            trigger_section,
-            text="Trigger AutoFocus",
-            command=self._on_trigger_autofocus,
+        self._register_toggleable(
+            ttk.Button(
+                trigger_section,
+                text="Trigger AutoFocus",
+                command=self._on_trigger_autofocus,
+            )
         ).pack(pady=5)
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
     def _setup_image_quality_tab(self, parent):
         """Setup image quality controls tab"""
-        # Create scrollable frame
-        canvas = tk.Canvas(parent)
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Color Controls Section
-        color_section = ttk.LabelFrame(
-            scrollable_frame, text="Color Adjustments", padding=5
-        )
-        color_section.pack(fill=tk.X, pady=(0, 10))
-
-        self._setup_manual_controls_in_frame(
-            color_section,
-            [
-                (
-                    "Brightness:",
-                    "brightness",
-                    self.settings_manager.BRIGHTNESS_MIN,
-                    self.settings_manager.BRIGHTNESS_MAX,
-                    self._on_brightness_changed,
-                ),
-                (
-                    "Contrast:",
-                    "contrast",
-                    self.settings_manager.CONTRAST_MIN,
-                    self.settings_manager.CONTRAST_MAX,
-                    self._on_contrast_changed,
-                ),
-                (
-                    "Saturation:",
-                    "saturation",
-                    self.settings_manager.SATURATION_MIN,
-                    self.settings_manager.SATURATION_MAX,
-                    self._on_saturation_changed,
-                ),
-                (
-                    "White Balance (K):",
-                    "white_balance",
-                    self.settings_manager.WB_MIN,
-                    self.settings_manager.WB_MAX,
-                    self._on_white_balance_changed,
-                ),
-            ],
-        )
-
-        # Image Enhancement Section
-        enhancement_section = ttk.LabelFrame(
-            scrollable_frame, text="Image Enhancement", padding=5
-        )
-        enhancement_section.pack(fill=tk.X)
-
-        self._setup_manual_controls_in_frame(
-            enhancement_section,
-            [
-                (
-                    "Sharpness:",
-                    "sharpness",
-                    self.settings_manager.SHARPNESS_MIN,
-                    self.settings_manager.SHARPNESS_MAX,
-                    self._on_sharpness_changed,
-                ),
-            ],
-        )
-
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        body = self._create_tab_body(parent)
+        self._setup_sections(body, self._IMAGE_QUALITY_SECTIONS)
 
     def _setup_advanced_tab(self, parent):
         """Setup advanced settings tab"""
-        # Create scrollable frame
-        canvas = tk.Canvas(parent)
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Noise Reduction Section
-        denoise_section = ttk.LabelFrame(
-            scrollable_frame, text="Noise Reduction", padding=5
-        )
-        denoise_section.pack(fill=tk.X, pady=(0, 10))
-
-        self._setup_manual_controls_in_frame(
-            denoise_section,
-            [
-                (
-                    "Luma Denoise:",
-                    "luma_denoise",
-                    0,
-                    4,
-                    lambda v: self.settings_manager.set_luma_denoise(v),
-                ),
-                (
-                    "Chroma Denoise:",
-                    "chroma_denoise",
-                    0,
-                    4,
-                    lambda v: self.settings_manager.set_chroma_denoise(v),
-                ),
-            ],
-        )
+        body = self._create_tab_body(parent)
+        self._setup_sections(body, self._ADVANCED_SECTIONS)
 
         # Other Advanced Settings
-        other_section = ttk.LabelFrame(
-            scrollable_frame, text="Other Settings", padding=5
-        )
+        other_section = ttk.LabelFrame(body, text="Other Settings", padding=5)
         other_section.pack(fill=tk.X, pady=(0, 10))
 
         # Anti-banding dropdown
@@ -675,15 +902,15 @@ class ControlPanel:
         anti_band_frame.pack(fill=tk.X, pady=2)
 
         ttk.Label(anti_band_frame, text="Anti-banding:").pack(side=tk.LEFT)
-        anti_banding_options = ["OFF", "50Hz", "60Hz", "AUTO"]
         self.widgets["anti_banding_var"] = tk.StringVar(value="AUTO")
         anti_banding_combo = ttk.Combobox(
             anti_band_frame,
             textvariable=self.widgets["anti_banding_var"],
-            values=anti_banding_options,
+            values=_ANTI_BANDING_OPTIONS,
             state="readonly",
             width=10,
         )
+        self._register_toggleable(anti_banding_combo)
         anti_banding_combo.pack(side=tk.LEFT, padx=10)
 
         # Effect mode dropdown
@@ -691,23 +918,15 @@ class ControlPanel:
         effect_frame.pack(fill=tk.X, pady=2)
 
         ttk.Label(effect_frame, text="Effect Mode:").pack(side=tk.LEFT)
-        effect_options = [
-            "OFF",
-            "MONO",
-            "NEGATIVE",
-            "SOLARIZE",
-            "SKETCH",
-            "WHITEBOARD",
-            "BLACKBOARD",
-        ]
         self.widgets["effect_mode_var"] = tk.StringVar(value="OFF")
         effect_combo = ttk.Combobox(
             effect_frame,
             textvariable=self.widgets["effect_mode_var"],
-            values=effect_options,
+            values=_EFFECT_OPTIONS,
             state="readonly",
             width=12,
         )
+        self._register_toggleable(effect_combo)
         effect_combo.pack(side=tk.LEFT, padx=10)
 
         # GPS interval control (meters)
@@ -726,67 +945,90 @@ class ControlPanel:
             width=8,
             command=lambda: self._on_gps_interval_changed(),
         )
+        self._register_toggleable(gps_spin)
         gps_spin.pack(side=tk.LEFT, padx=10)
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+    def _setup_checkbuttons_in_frame(self, parent, checks):
+        """Setup auto mode / lock checkbuttons in a given frame"""
+        for text, key in checks:
+            var = tk.BooleanVar(
+                value=self.settings_manager.get_auto_mode(self._AUTO_MODE_KEYS[key])
+            )
+            self.widgets[key] = var
+            self._register_toggleable(
+                ttk.Checkbutton(
+                    parent,
+                    text=text,
+                    variable=var,
+                    command=partial(self._on_check_toggled, key),
+                )
+            ).pack(anchor=tk.W, pady=2)
 
     def _setup_manual_controls_in_frame(self, parent, controls):
         """Setup manual controls with sliders in a given frame"""
-        for i, (label, key, min_val, max_val, callback) in enumerate(controls):
-            # Control frame
-            control_frame = ttk.Frame(parent)
-            control_frame.pack(fill=tk.X, pady=2)
+        # One grid for all rows: label | scale (stretches) | value
+        parent.columnconfigure(1, weight=1)
+        for row, (label, key) in enumerate(controls):
+            min_val, max_val = self._ranges[key]
 
             # Label
-            ttk.Label(control_frame, text=label, width=15).pack(side=tk.LEFT)
+            ttk.Label(parent, text=label, width=15).grid(
+                row=row, column=0, sticky=tk.W, pady=2
+            )
 
-            # Variable - ensure integer value
-            setting_value = self.settings_manager.get_setting(key)
-            var = tk.IntVar(value=int(setting_value) if setting_value is not None else 0)
-            self.widgets[f"{key}_var"] = var
+            # Initial value - get_setting already coerces to int
+            initial = self.settings_manager.get_setting(key)
 
-            # Scale
+            # Scale (no linked variable; the command callback is the only path)
             scale = ttk.Scale(
-                control_frame,
+                parent,
                 from_=min_val,
                 to=max_val,
-                variable=var,
+                value=initial,
                 orient=tk.HORIZONTAL,
                 length=150,
-                command=lambda v, k=key, va=var: self._on_manual_control_changed(k, int(va.get())),
+                command=partial(self._on_manual_control_changed, key),
             )
-            scale.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
-
-            # Value label
-            value_label = ttk.Label(control_frame, textvariable=var, width=6)
-            value_label.pack(side=tk.RIGHT)
+            self._register_toggleable(scale)
+            scale.grid(row=row, column=1, sticky=tk.EW, padx=5, pady=2)
+            scale.bind("<ButtonRelease-1>", partial(self._on_slider_released, key))
+            self.widgets[f"{key}_scale"] = scale
+
+            # Value label; set explicitly so a drag doesn't redraw it per tick
+            value_label = ttk.Label(parent, text=str(initial), width=6)
+            value_label.grid(row=row, column=2, sticky=tk.E, pady=2)
+            self.widgets[f"{key}_value_label"] = value_label
+
+    @staticmethod
+    def _parse_resolution(res_str: str) -> Optional[Tuple[int, int]]:
+        """Parse a "WIDTHxHEIGHT" string, returning None if it is invalid"""
+        w_str, sep, h_str = res_str.partition("x")
+        if not sep:
+            return None
+        try:
+            return int(w_str.strip()), int(h_str.strip())
+        except ValueError:
+            return None
 
     def _on_apply_stream_settings(self):
         """Apply stream settings"""
         if self.on_settings_change:
-            # Parse CAM_A resolution
-            cam_a_res = self.widgets["cam_a_resolution_var"].get()
-            if "x" not in cam_a_res:
-                tk.messagebox.showerror(
-                    "Invalid Resolution", "Please select a valid CAM_A resolution"
-                )
-                return
-            cam_a_w_str, cam_a_h_str = cam_a_res.split("x")
-            try:
-                cam_a_w = int(cam_a_w_str.strip())
-                cam_a_h = int(cam_a_h_str.strip())
-            except ValueError:
-                tk.messagebox.showerror(
+            # Look up CAM_A resolution (the dropdown is readonly)
+            parsed = self.cam_a_resolution_options.get(
+                self.widgets["cam_a_resolution_var"].get()
+            )
+            if parsed is None:
+                messagebox.showerror(
                     "Invalid Resolution", "Please select a valid CAM_A resolution"
                 )
                 return
+            cam_a_w, cam_a_h = parsed
 
             # Parse FPS
             try:
                 fps = int(self.widgets["fps_var"].get())
             except ValueError:
-                tk.messagebox.showerror(
+                messagebox.showerror(
                     "Invalid FPS", "Please select a valid FPS value"
                 )
                 return
@@ -805,72 +1047,134 @@ class ControlPanel:
             }
             self.on_settings_change(settings)
 
-    # Auto control event handlers
-    def _on_auto_exposure_changed(self):
-        self.settings_manager.set_auto_exposure(self.widgets["auto_exposure"].get())
+    def _value_changed(self, key: str, value: Any) -> bool:
+        """Record value for key, returning False if it matches the last one"""
+        if self._last_values.get(key) == value:
+            return False
+        self._last_values[key] = value
+        # The settings manager is about to diverge from the last snapshot
+        self._invalidate_snapshot()
+        return True
 
-    def _on_auto_focus_changed(self):
-        self.settings_manager.set_auto_focus(self.widgets["auto_focus"].get())
+    def _invalidate_snapshot(self, event=None):
+        """Make the next update_all_widgets pass refresh every widget
 
-    def _on_auto_wb_changed(self):
-        self.settings_manager.set_auto_white_balance(self.widgets["auto_wb"].get())
+        Called whenever a widget changes, including dropdown picks that
+        have not been applied, so they no longer match the last snapshot.
+        """
+        self._last_snapshot_key = None
 
-    def _on_ae_lock_changed(self):
-        self.settings_manager.set_auto_exposure_lock(self.widgets["ae_lock"].get())
+    # Auto control event handlers
+    def _on_check_toggled(self, key: str):
+        """Forward a checkbutton toggle to the settings manager"""
+        self._dispatch(key, self.widgets[key].get())
 
-    def _on_awb_lock_changed(self):
-        self.settings_manager.set_auto_white_balance_lock(
-            self.widgets["awb_lock"].get()
-        )
+    def _dispatch(self, key: str, value: Any):
+        """Forward a toggle change to its settings manager setter"""
+        if self._suppress_events or not self._value_changed(key, value):
+            return
+        getattr(self.settings_manager, self._SETTER[key])(value)
 
     def _on_trigger_autofocus(self):
         self.settings_manager.trigger_autofocus()
 
     # Manual control event handlers
-    def _on_exposure_changed(self, value: int):
-        self.settings_manager.set_exposure(value)
-
-    def _on_iso_changed(self, value: int):
-        self.settings_manager.set_iso(value)
-
-    def _on_focus_changed(self, value: int):
-        self.settings_manager.set_focus(value)
-
-    def _on_brightness_changed(self, value: int):
-        self.settings_manager.set_brightness(value)
-
-    def _on_contrast_changed(self, value: int):
-        self.settings_manager.set_contrast(value)
-
-    def _on_saturation_changed(self, value: int):
-        self.settings_manager.set_saturation(value)
-
-    def _on_sharpness_changed(self, value: int):
-        self.settings_manager.set_sharpness(value)
-
-    def _on_white_balance_changed(self, value: int):
-        self.settings_manager.set_white_balance(value)
-
-    def _on_manual_control_changed(self, key: str, value: int):
+    def _on_manual_control_changed(self, key: str, value: str):
         """Handle manual control changes - only update settings, don't apply to camera"""
+        if self._suppress_events:
+            return
+        # ttk.Scale passes its new position as a float string
+        value = int(float(value))
+
+        # Debounce: only the last value within the window is written
+        pending = self._pending_after.get(key)
+        if pending is not None:
+            self.parent.after_cancel(pending)
+        self._pending_after[key] = self.parent.after(
+            self._SLIDER_DEBOUNCE_MS, self._apply_manual_control, key, value
+        )
+
+    def _on_slider_released(self, key: str, event=None):
+        """Commit a slider's final position as soon as the drag ends"""
+        pending = self._pending_after.get(key)
+        if pending is None:
+            return
+        self.parent.after_cancel(pending)
+        self._apply_manual_control(key, int(float(event.widget.get())))
+
+    def _apply_manual_control(self, key: str, value: int):
+        """Write a debounced slider value to the settings manager"""
+        self._pending_after.pop(key, None)
+        self._show_value(key, value)
+        if not self._value_changed(key, value):
+            return
         self.settings_manager.update_setting(key, value)
 
+    def _show_value(self, key: str, value: int):
+        """Update a manual control's value label"""
+        label = self.widgets.get(f"{key}_value_label")
+        if label is not None:
+            label.config(text=str(value))
+
     def _on_gps_interval_changed(self):
+        if self._suppress_events:
+            return
         try:
             val = float(self.widgets["gps_interval_var"].get())
             if val <= 0:
                 val = 1.0
             self.settings_manager.update_setting("gps_interval_m", val)
+            self._invalidate_snapshot()
         except Exception:
             pass
 
     # Public interface methods
+    def destroy(self):
+        """Destroy the panel's widgets and cancel its pending callbacks"""
+        for pending in self._pending_after.values():
+            self.parent.after_cancel(pending)
+        self._pending_after.clear()
+        if self._bulk_update_id is not None:
+            self.parent.after_cancel(self._bulk_update_id)
+            self._bulk_update_id = None
+
+        for section in self._sections:
+            section.destroy()
+        self._sections = []
+        if self._custom_res_dialog is not None:
+            self._custom_res_dialog.destroy()
+            self._custom_res_dialog = None
+        self.widgets.clear()
+        self._toggleable.clear()
+        self._controls_built = False
+        _clear_callbacks(self)
+
     def set_callbacks(self, **callbacks):
         """Set callback functions for various events"""
         for name, callback in callbacks.items():
-            if hasattr(self, f"on_{name}"):
+            if name in self._CALLBACK_NAMES:
                 setattr(self, f"on_{name}", callback)
 
+    def _register_toggleable(self, widget: ttk.Widget) -> ttk.Widget:
+        """Track a widget for enable_controls, matching the current state"""
+        self._toggleable.append(widget)
+        if not self._controls_enabled:
+            widget.state(["disabled"])
+        return widget
+
+    def enable_controls(self, enabled: bool):
+        """Enable or disable all interactive controls"""
+        if enabled == self._controls_enabled:
+            return
+        self._controls_enabled = enabled
+        if not self._toggleable:
+            return
+        # One Tcl script for every widget instead of a round-trip each
+        state_spec = "!disabled" if enabled else "disabled"
+        self.parent.tk.eval(
+            "\n".join(f"{widget} state {state_spec}" for widget in self._toggleable)
+        )
+
     def update_device_info(self, device_info: Optional[Dict] = None):
         """Update device information display"""
         if device_info:
@@ -880,81 +1184,84 @@ class ControlPanel:
         else:
             self.widgets["device_info_label"].config(text="No device connected")
 
-    def update_all_widgets(self):
-        """Update all widget values from settings manager"""
-        # Update auto mode checkboxes
-        if "auto_exposure" in self.widgets:
-            self.widgets["auto_exposure"].set(
-                self.settings_manager.get_auto_mode("auto_exposure")
-            )
-        if "auto_focus" in self.widgets:
-            self.widgets["auto_focus"].set(
-                self.settings_manager.get_auto_mode("auto_focus")
-            )
-        if "auto_wb" in self.widgets:
-            self.widgets["auto_wb"].set(
-                self.settings_manager.get_auto_mode("auto_white_balance")
-            )
-        if "ae_lock" in self.widgets:
-            self.widgets["ae_lock"].set(
-                self.settings_manager.get_auto_mode("auto_exposure_lock")
-            )
-        if "awb_lock" in self.widgets:
-            self.widgets["awb_lock"].set(
-                self.settings_manager.get_auto_mode("auto_white_balance_lock")
-            )
-
-        # Update manual control values - ensure integer values
-        manual_controls = [
-            "exposure",
-            "iso",
-            "focus",
-            "brightness",
-            "contrast",
-            "saturation",
-            "sharpness",
-            "white_balance",
-            "luma_denoise",
-            "chroma_denoise",
-        ]
-
-        for control in manual_controls:
-            var_key = f"{control}_var"
-            if var_key in self.widgets:
-                setting_value = self.settings_manager.get_setting(control)
-                self.widgets[var_key].set(int(setting_value) if setting_value is not None else 0)
-
-        # Update CAM_A resolution (keep default if not set yet)
-        if "cam_a_resolution_var" in self.widgets:
-            # Try to infer from settings manager, else keep current
-            width = self.settings_manager.get_setting("resolution_width")
-            height = self.settings_manager.get_setting("resolution_height")
-            res_str = f"{width}x{height}"
-            if res_str in getattr(self, "cam_a_resolution_options", []):
-                self.widgets["cam_a_resolution_var"].set(res_str)
-
-        # Update FPS
-        if "fps_var" in self.widgets:
-            self.widgets["fps_var"].set(str(self.settings_manager.get_setting("fps")))
+    @staticmethod
+    def _set_if_changed(var: Any, value: Any):
+        """Set a Tk variable or scale only if its value differs"""
+        try:
+            if var.get() == value:
+                return
+        except tk.TclError:
+            pass
+        var.set(value)
+
+    def update_all_widgets(self, force: bool = False):
+        """Schedule a refresh of all widget values from settings manager
+
+        The refresh runs once the current event has been handled, and
+        repeated calls before then collapse into a single pass. With force,
+        widgets are rewritten even if the settings match the last snapshot.
+        """
+        if force:
+            self._invalidate_snapshot()
+        if self._bulk_update_id is None:
+            self._bulk_update_id = self.parent.after_idle(self._do_bulk_update)
+
+    def _do_bulk_update(self):
+        """Refresh all widget values from a single settings snapshot"""
+        self._bulk_update_id = None
+        snap = self.settings_manager.get_settings_bulk(self._REFRESH_KEYS)
+        # Widgets already reflect this exact snapshot; nothing to refresh
+        snapshot_key = hash(tuple(sorted(snap.items())))
+        if snapshot_key == self._last_snapshot_key:
+            return
+        self._last_snapshot_key = snapshot_key
+
+        # Settings may have changed underneath the sliders (e.g. reset), so
+        # drop slider writes that haven't fired yet for those settings only;
+        # a write for an untouched setting is still the user's latest value
+        changed = {
+            key for key, value in snap.items() if self._last_snapshot.get(key) != value
+        }
+        self._last_snapshot = snap
+        for key in changed.intersection(self._pending_after):
+            self.parent.after_cancel(self._pending_after.pop(key))
+        self._last_values.clear()
+        with suppress_events(self, flush=self.parent):
+            # Update auto mode checkboxes
+            for widget_key, setting_key in self._AUTO_MODE_KEYS.items():
+                if widget_key in self.widgets:
+                    self._set_if_changed(
+                        self.widgets[widget_key], bool(snap[setting_key])
+                    )
+
+            # Update manual control values (already coerced to int)
+            for key in self._MANUAL_KEYS:
+                scale = self.widgets.get(f"{key}_scale")
+                # Leave a slider alone while its own write is still pending
+                if scale is not None and key not in self._pending_after:
+                    self._set_if_changed(scale, snap[key])
+                    self._show_value(key, snap[key])
+
+            # Update CAM_A resolution (keep default if not set yet)
+            if "cam_a_resolution_var" in self.widgets:
+                # Try to infer from settings manager, else keep current
+                res_str = f"{snap['resolution_width']}x{snap['resolution_height']}"
+                if res_str in getattr(self, "cam_a_resolution_options", []):
+                    self._set_if_changed(self.widgets["cam_a_resolution_var"], res_str)
+
+            # Update FPS
+            if "fps_var" in self.widgets:
+                self._set_if_changed(self.widgets["fps_var"], str(snap["fps"]))
 
     def get_current_settings(self) -> Dict[str, Any]:
         """Get current resolution and FPS settings"""
         settings = {}
         # CAM_A resolution
         cam_a_res = self.widgets.get("cam_a_resolution_var")
-        if cam_a_res:
-            res_str = cam_a_res.get()
-            if "x" in res_str:
-                w_str, h_str = res_str.split("x")
-                try:
-                    cam_a_w = int(w_str.strip())
-                    cam_a_h = int(h_str.strip())
-                except ValueError:
-                    cam_a_w, cam_a_h = 1024, 768
-            else:
-                cam_a_w, cam_a_h = 1024, 768
-        else:
-            cam_a_w, cam_a_h = 1024, 768
+        parsed = (
+            self.cam_a_resolution_options.get(cam_a_res.get()) if cam_a_res else None
+        )
+        cam_a_w, cam_a_h = parsed or (1024, 768)
 
         # Backward compatible top-level size (use CAM_A)
         settings["width"], settings["height"] = cam_a_w, cam_a_h
@@ -5,7 +5,9 @@ import threading
 import time
 import numpy as np
 from PIL import Image, ImageTk
-from typing import Dict, Optional, TYPE_CHECKING, Callable, Tuple
+from collections import deque
+from functools import partial
+from typing import Deque, Dict, List, Optional, TYPE_CHECKING, Callable, Tuple
 from pathlib import Path
 
 if TYPE_CHECKING:
@@ -40,39 +42,53 @@ class MenuBarManager:
         # File menu
         file_menu = tk.Menu(self.menubar, tearoff=0)
         self.menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(
-            label="Open Save Directory", command=self._on_open_save_dir
-        )
+        self._add_item(file_menu, "Open Save Directory", "open_save_dir")
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self._on_exit)
+        self._add_item(file_menu, "Exit", "exit")
 
         # Camera menu
         camera_menu = tk.Menu(self.menubar, tearoff=0)
         self.menubar.add_cascade(label="Camera", menu=camera_menu)
-        camera_menu.add_command(label="Connect", command=self._on_connect)
-        camera_menu.add_command(label="Disconnect", command=self._on_disconnect)
+        self._add_item(camera_menu, "Connect", "connect")
+        self._add_item(camera_menu, "Disconnect", "disconnect")
         camera_menu.add_separator()
-        camera_menu.add_command(label="Capture Images", command=self._on_capture)
-        camera_menu.add_command(
-            label="Toggle Recording", command=self._on_record_toggle
-        )
+        self._add_item(camera_menu, "Capture Images", "capture")
+        self._add_item(camera_menu, "Toggle Recording", "record_toggle")
         camera_menu.add_separator()
-        camera_menu.add_command(label="Reset Settings", command=self._on_reset_settings)
+        self._add_item(camera_menu, "Reset Settings", "reset_settings")
 
         # View menu
         view_menu = tk.Menu(self.menubar, tearoff=0)
         self.menubar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_command(
-            label="Refresh Displays", command=self._on_refresh_displays
-        )
+        self._add_item(view_menu, "Refresh Displays", "refresh_displays")
 
         # Help menu
         help_menu = tk.Menu(self.menubar, tearoff=0)
         self.menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(
-            label="Keyboard Shortcuts", command=self._on_show_shortcuts
-        )
-        help_menu.add_command(label="About", command=self._on_show_about)
+        self._add_item(help_menu, "Keyboard Shortcuts", "show_shortcuts")
+        self._add_item(help_menu, "About", "show_about")
+
+    def _add_item(self, menu: tk.Menu, label: str, name: str):
+        """Add a menu command that dispatches to the item's current callback"""
+        # The Tcl command is registered once here; set_callbacks only swaps
+        # the Python callback it looks up, so rebinding registers nothing new
+        menu.add_command(label=label, command=partial(self._invoke, name))
+
+    def _invoke(self, name: str):
+        """Run a menu item's callback"""
+        self._command_for(name)()
+
+    def _command_for(self, name: str) -> Callable:
+        """Callback for a menu item, falling back to its default action"""
+        callback = getattr(self, f"on_{name}")
+        if callback:
+            return callback
+        defaults = {
+            "show_shortcuts": self._default_show_shortcuts,
+            "show_about": self._default_show_about,
+            "exit": self.root.quit,
+        }
+        return defaults.get(name, lambda: None)
 
     def set_callbacks(self, **callbacks):
         """Set callback functions for menu actions"""
@@ -80,53 +96,6 @@ class MenuBarManager:
             if hasattr(self, f"on_{name}"):
                 setattr(self, f"on_{name}", callback)
 
-    # Menu event handlers
-    def _on_open_save_dir(self):
-        if self.on_open_save_dir:
-            self.on_open_save_dir()
-
-    def _on_connect(self):
-        if self.on_connect:
-            self.on_connect()
-
-    def _on_disconnect(self):
-        if self.on_disconnect:
-            self.on_disconnect()
-
-    def _on_capture(self):
-        if self.on_capture:
-            self.on_capture()
-
-    def _on_record_toggle(self):
-        if self.on_record_toggle:
-            self.on_record_toggle()
-
-    def _on_reset_settings(self):
-        if self.on_reset_settings:
-            self.on_reset_settings()
-
-    def _on_refresh_displays(self):
-        if self.on_refresh_displays:
-            self.on_refresh_displays()
-
-    def _on_show_shortcuts(self):
-        if self.on_show_shortcuts:
-            self.on_show_shortcuts()
-        else:
-            self._default_show_shortcuts()
-
-    def _on_show_about(self):
-        if self.on_show_about:
-            self.on_show_about()
-        else:
-            self._default_show_about()
-
-    def _on_exit(self):
-        if self.on_exit:
-            self.on_exit()
-        else:
-            self.root.quit()
-
     def _default_show_shortcuts(self):
         """Default keyboard shortcuts dialog"""
         shortcuts_text = """Keyboard Shortcuts:
@@ -181,6 +150,7 @@ class StatusBarManager:
         # FPS display
         self.fps_label = ttk.Label(self.status_bar, text="FPS: 0.0", relief=tk.SUNKEN)
         self.fps_label.pack(side=tk.RIGHT, padx=5)
+        self._fps_text = "FPS: 0.0"
 
     def update_status(self, message: str):
         """Update status bar message"""
@@ -189,26 +159,61 @@ class StatusBarManager:
 
     def update_fps(self, fps: float):
         """Update FPS display"""
-        self.fps_label.config(text=f"FPS: {fps:.1f}")
+        text = f"FPS: {fps:.1f}"
+        if text != self._fps_text:
+            self.fps_label.config(text=text)
+            self._fps_text = text
 
 
 class DisplayManager:
     """Manages camera display and UI updates"""
 
+    # Number of recent frame times used for the rolling FPS figure
+    _FPS_WINDOW = 64
+    # Minimum seconds between repeated reports of the same per-frame error
+    _ERROR_REPORT_INTERVAL = 5.0
+
     def __init__(self, notebook: ttk.Notebook):
         self.notebook = notebook
         self.camera_frames: Dict[str, ttk.Label] = {}
         self.camera_info_labels: Dict[str, ttk.Label] = {}
+        # Built tab per camera: (frame, image label, info label, fps label).
+        # Tabs are hidden on clear and re-shown on reconnect, not rebuilt
+        self._camera_tabs: Dict[
+            str, Tuple[ttk.Frame, ttk.Label, ttk.Label, ttk.Label]
+        ] = {}
         self.display_thread: Optional[threading.Thread] = None
         self.running = False
+        # Set to wake the display loop out of its frame-pacing wait on stop
+        self._stop_event = threading.Event()
 
         # Display settings
         self.display_width = 640
         self.target_fps = 30
-        # Per-camera FPS tracking
-        self._camera_frame_counts: Dict[str, int] = {}
-        self._camera_last_update: Dict[str, float] = {}
-        self._camera_current_fps: Dict[str, float] = {}
+        # Per-camera FPS tracking: recent frame times (perf_counter_ns) and
+        # when each camera's FPS label is next due for a refresh
+        self._frame_times: Dict[str, Deque[int]] = {}
+        self._fps_label_due: Dict[str, int] = {}
+        self._fps_texts: Dict[str, str] = {}
+        # Last raw frame rendered per camera; get_frame hands back the same
+        # cached array when no new frame has arrived
+        self._last_rendered: Dict[str, np.ndarray] = {}
+        # Per-camera resize buffer and Tk image, reused while the size holds
+        self._display_buffers: Dict[str, np.ndarray] = {}
+        self._photos: Dict[str, ImageTk.PhotoImage] = {}
+        self._info_texts: Dict[str, str] = {}
+        # Frames prepared by the display thread, waiting for the Tk thread
+        self._pending_frames: Dict[str, Tuple[Image.Image, str, np.ndarray]] = {}
+        # Free RGBA buffers per camera, handed between the two threads
+        self._rgba_pool: Dict[str, List[np.ndarray]] = {}
+        self._pending_lock = threading.Lock()
+        # Per-frame error throttling: key -> (last report time, suppressed)
+        self._error_reports: Dict[str, Tuple[float, int]] = {}
+
+        # Camera whose tab is showing; only that one is rendered. Tracked on
+        # the Tk thread so the display thread never has to query the notebook
+        self._active_camera: Optional[str] = None
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
 
         # Mouse event handling for ROI
         self.roi_manager = None
@@ -217,6 +222,25 @@ class DisplayManager:
 
     def setup_camera_tab(self, camera_name: str):
         """Setup display tab for a camera"""
+        cached = self._camera_tabs.get(camera_name)
+        if cached is not None:
+            frame, image_label, info_label, fps_label = cached
+            self.notebook.add(frame, text=camera_name)
+            # Re-adding a hidden tab does not select it; with every tab
+            # hidden there is no current tab, so pick this one
+            if not self.notebook.select():
+                self.notebook.select(frame)
+                self._active_camera = camera_name
+            image_label.config(
+                image="", text=f"Camera {camera_name}\nWaiting for frames..."
+            )
+            info_label.config(text=f"Camera {camera_name} - No Image")
+            fps_label.config(text="FPS: 0.0")
+            self.camera_info_labels[camera_name] = info_label
+            self.camera_frames[camera_name] = image_label
+            self.camera_frames[f"{camera_name}_fps"] = fps_label
+            return
+
         frame = ttk.Frame(self.notebook)
         self.notebook.add(frame, text=camera_name)
 
@@ -262,6 +286,12 @@ class DisplayManager:
 
         # Store fps label reference for updates
         self.camera_frames[f"{camera_name}_fps"] = fps_label
+        self._camera_tabs[camera_name] = (frame, image_label, info_label, fps_label)
+
+    def _on_tab_changed(self, event=None):
+        """Remember which camera tab is visible"""
+        current = self.notebook.select()
+        self._active_camera = self.notebook.tab(current, "text") if current else None
 
     def _on_mouse_down(self, camera_name: str, event):
         """Handle mouse button press for ROI selection"""
@@ -318,85 +348,197 @@ class DisplayManager:
     def update_camera_display(
         self, camera_name: str, image: np.ndarray, frame_info: Optional[Dict] = None
     ):
-        """Update camera display with new image and info"""
+        """Prepare a frame for display (safe to call from the display thread)"""
         try:
             # Store original frame size
             original_height, original_width = image.shape[:2]
             self._camera_frame_sizes[camera_name] = (original_width, original_height)
 
-            # Convert BGR to RGB
-            img_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-
             # Calculate display size maintaining aspect ratio
             display_height = int(original_height * self.display_width / original_width)
             self._camera_display_sizes[camera_name] = (self.display_width, display_height)
 
-            # Resize for display
-            img_display = cv2.resize(img_rgb, (self.display_width, display_height))
-
-            # Convert to PhotoImage
-            pil_image = Image.fromarray(img_display)
-            photo = ImageTk.PhotoImage(pil_image)
+            if original_width == self.display_width:
+                # Already display-sized (same aspect, so same height too):
+                # convert straight from the source
+                img_display = image
+            else:
+                img_display = self._resize_for_display(
+                    camera_name, image, display_height
+                )
+
+            # Convert the downscaled pixels into an RGBA buffer, which PIL can
+            # wrap without copying (RGB is not one of its zero-copy modes).
+            # The buffer belongs to the pending frame until Tk has pasted it.
+            rgba_shape = (display_height, self.display_width, 4)
+            with self._pending_lock:
+                pool = self._rgba_pool.setdefault(camera_name, [])
+                rgba = pool.pop() if pool else None
+            if rgba is None or rgba.shape != rgba_shape:
+                rgba = np.empty(rgba_shape, dtype=np.uint8)
+            cv2.cvtColor(img_display, cv2.COLOR_BGR2RGBA, dst=rgba)
+            pil_image = Image.frombuffer(
+                "RGBA", (self.display_width, display_height), rgba, "raw", "RGBA", 0, 1
+            )
 
-            # Update display
-            if camera_name in self.camera_frames:
-                self.camera_frames[camera_name].config(image=photo, text="")
-                self.camera_frames[camera_name].image = photo  # Keep reference
+            info_text = f"Camera {camera_name} - {original_width}x{original_height}"
+            if frame_info:
+                if "exposure" in frame_info:
+                    info_text += f" | Exp: {frame_info['exposure']}μs"
+                if "sequence" in frame_info:
+                    info_text += f" | Frame: {frame_info['sequence']}"
+
+            # Hand the result to the Tk thread; if a frame is already waiting
+            # it is simply replaced, so Tk only ever shows the newest one
+            with self._pending_lock:
+                replaced = self._pending_frames.get(camera_name)
+                self._pending_frames[camera_name] = (pil_image, info_text, rgba)
+                if replaced is not None:
+                    # Tk never saw the replaced frame; its buffer is free again
+                    pool.append(replaced[2])
+            if replaced is None:
+                self.notebook.after_idle(self._apply_camera_display, camera_name)
 
-                # Update info label
-                info_text = f"Camera {camera_name} - {original_width}x{original_height}"
-                if frame_info:
-                    if "exposure" in frame_info:
-                        info_text += f" | Exp: {frame_info['exposure']}μs"
-                    if "sequence" in frame_info:
-                        info_text += f" | Frame: {frame_info['sequence']}"
+        except Exception as e:
+            self._report_error(
+                f"display:{camera_name}",
+                f"Display update error for {camera_name}: {e}",
+            )
 
-                if camera_name in self.camera_info_labels:
-                    self.camera_info_labels[camera_name].config(text=info_text)
+    def _resize_for_display(
+        self, camera_name: str, image: np.ndarray, display_height: int
+    ) -> np.ndarray:
+        """Resize a frame into this camera's reusable display buffer"""
+        img_display = self._display_buffers.get(camera_name)
+        if img_display is None or img_display.shape[:2] != (
+            display_height,
+            self.display_width,
+        ):
+            img_display = np.empty(
+                (display_height, self.display_width, 3), dtype=np.uint8
+            )
+            self._display_buffers[camera_name] = img_display
+        # INTER_AREA averages source pixels when shrinking (no aliasing, and
+        # OpenCV has a fast path for integer ratios); linear when enlarging
+        interpolation = (
+            cv2.INTER_AREA if image.shape[1] > self.display_width else cv2.INTER_LINEAR
+        )
+        cv2.resize(
+            image,
+            (self.display_width, display_height),
+            dst=img_display,
+            interpolation=interpolation,
+        )
+        return img_display
 
-                # Update FPS
-                self._update_fps_display(camera_name)
+    def _apply_camera_display(self, camera_name: str):
+        """Show the newest prepared frame for a camera (Tk thread only)"""
+        with self._pending_lock:
+            pending = self._pending_frames.pop(camera_name, None)
+        if pending is None or camera_name not in self.camera_frames:
+            return
+        pil_image, info_text, rgba = pending
+        try:
+            label = self.camera_frames[camera_name]
+            photo = self._photos.get(camera_name)
+            if photo is not None and (photo.width(), photo.height()) == pil_image.size:
+                # Same size: update the existing Tk image in place
+                photo.paste(pil_image)
+            else:
+                photo = ImageTk.PhotoImage(pil_image)
+                self._photos[camera_name] = photo
+                label.config(image=photo, text="")
+                label.image = photo  # Keep reference
+
+            # Update info label
+            info_label = self.camera_info_labels.get(camera_name)
+            text_changed = self._info_texts.get(camera_name) != info_text
+            if info_label is not None and text_changed:
+                info_label.config(text=info_text)
+                self._info_texts[camera_name] = info_text
+
+            # Update FPS
+            self._update_fps_display(camera_name)
 
         except Exception as e:
-            print(f"Display update error for {camera_name}: {e}")
+            self._report_error(
+                f"display:{camera_name}",
+                f"Display update error for {camera_name}: {e}",
+            )
+        finally:
+            # The frame has been copied into Tk; let the display thread reuse it
+            with self._pending_lock:
+                self._rgba_pool.setdefault(camera_name, []).append(rgba)
 
     def _update_fps_display(self, camera_name: str):
-        """Update FPS display for camera (per-camera measurement)"""
+        """Record a displayed frame and refresh the camera's FPS label"""
         try:
-            current_time = time.time()
-            # Initialize counters for this camera if needed
-            if camera_name not in self._camera_frame_counts:
-                self._camera_frame_counts[camera_name] = 0
-                self._camera_last_update[camera_name] = current_time
-                self._camera_current_fps[camera_name] = 0.0
-
-            self._camera_frame_counts[camera_name] += 1
-
-            # Update per-camera FPS every second
-            elapsed = current_time - self._camera_last_update[camera_name]
-            if elapsed >= 1.0:
-                fps = self._camera_frame_counts[camera_name] / max(elapsed, 1e-6)
-                self._camera_current_fps[camera_name] = fps
-                self._camera_frame_counts[camera_name] = 0
-                self._camera_last_update[camera_name] = current_time
-
-                # Update FPS label for this camera
-                fps_label_key = f"{camera_name}_fps"
-                if fps_label_key in self.camera_frames:
-                    self.camera_frames[fps_label_key].config(
-                        text=f"FPS: {fps:.1f}"
-                    )
+            current_time = time.perf_counter_ns()
+            times = self._frame_times.get(camera_name)
+            if times is None:
+                times = self._frame_times[camera_name] = deque(
+                    maxlen=self._FPS_WINDOW
+                )
+            elif times and current_time - times[-1] > 1_000_000_000:
+                # Rendering paused (tab hidden); don't average across the gap
+                times.clear()
+            times.append(current_time)
+
+            # Update the FPS label for this camera once a second
+            if current_time < self._fps_label_due.get(camera_name, 0):
+                return
+            self._fps_label_due[camera_name] = current_time + 1_000_000_000
+            fps_label = self.camera_frames.get(f"{camera_name}_fps")
+            text = f"FPS: {self._rolling_fps(times):.1f}"
+            if fps_label is not None and self._fps_texts.get(camera_name) != text:
+                fps_label.config(text=text)
+                self._fps_texts[camera_name] = text
         except Exception as e:
-            print(f"FPS update error: {e}")
+            self._report_error("fps", f"FPS update error: {e}")
+
+    @staticmethod
+    def _rolling_fps(times: Deque[int]) -> float:
+        """FPS over the frame times currently held in the window"""
+        if len(times) < 2:
+            return 0.0
+        span_ns = times[-1] - times[0]
+        return (len(times) - 1) * 1e9 / span_ns if span_ns > 0 else 0.0
+
+    def _report_error(self, key: str, message: str):
+        """Print a per-frame error, at most once per interval for each key"""
+        now = time.perf_counter()
+        last, suppressed = self._error_reports.get(key, (None, 0))
+        if last is not None and now - last < self._ERROR_REPORT_INTERVAL:
+            self._error_reports[key] = (last, suppressed + 1)
+            return
+        if suppressed:
+            message += f" ({suppressed} similar errors suppressed)"
+        self._error_reports[key] = (now, 0)
+        print(message)
 
     def clear_displays(self):
         """Clear all camera displays"""
+        # Hide built camera tabs so a reconnect can re-show them as they are
+        cached = {str(tab[0]) for tab in self._camera_tabs.values()}
         for child in self.notebook.tabs():
-            self.notebook.forget(child)
+            if child in cached:
+                self.notebook.hide(child)
+            else:
+                self.notebook.forget(child)
         self.camera_frames.clear()
         self.camera_info_labels.clear()
         self._camera_display_sizes.clear()
         self._camera_frame_sizes.clear()
+        self._last_rendered.clear()
+        self._display_buffers.clear()
+        self._photos.clear()
+        self._info_texts.clear()
+        self._frame_times.clear()
+        self._fps_label_due.clear()
+        self._fps_texts.clear()
+        with self._pending_lock:
+            self._pending_frames.clear()
+            self._rgba_pool.clear()
 
     def start_display_loop(
         self, camera_controller: "CameraController", file_manager: "FileManager", 
@@ -407,6 +549,7 @@ class DisplayManager:
             return
 
         self.running = True
+        self._stop_event.clear()
         self.roi_manager = roi_manager  # Store reference to ROI manager
         self.lane_detector = lane_detector  # Store reference to lane detector
         self.lane_visualizer = lane_visualizer  # Store reference to lane visualizer
@@ -420,6 +563,7 @@ class DisplayManager:
     def stop_display_loop(self):
         """Stop the display update loop"""
         self.running = False
+        self._stop_event.set()
         if self.display_thread and self.display_thread.is_alive():
             self.display_thread.join(timeout=1.0)
 
@@ -431,12 +575,27 @@ class DisplayManager:
         frame_interval = 1.0 / self.target_fps
 
         while self.running:
-            loop_start = time.time()
+            loop_start = time.perf_counter()
 
             try:
+                recording = file_manager.is_recording()
+                # Other readers (lane detection, captures) drain the same
+                # queues, so hold what they skip past for the recorder
+                camera_controller.set_keep_unread_frames(recording)
                 for camera_name in camera_controller.get_connected_cameras():
-                    frame = camera_controller.get_frame(camera_name)
-                    if frame is not None:
+                    if recording:
+                        # The recorder needs every frame, not just the newest
+                        frames = camera_controller.get_new_frames(camera_name)
+                    else:
+                        frame = camera_controller.get_frame(camera_name)
+                        frames = (
+                            [frame]
+                            if frame is not None
+                            and frame is not self._last_rendered.get(camera_name)
+                            else []
+                        )
+                    for index, frame in enumerate(frames, 1):
+                        self._last_rendered[camera_name] = frame
                         # Apply ROI overlay if available
                         if roi_manager:
                             frame = roi_manager.draw_roi_overlay(frame, camera_name)
@@ -454,22 +613,24 @@ class DisplayManager:
                             "channels": frame.shape[2] if len(frame.shape) > 2 else 1,
                         }
 
-                        # Update display
-                        self.update_camera_display(camera_name, frame, frame_info)
+                        # Update display with the newest frame only (hidden
+                        # tabs aren't rendered at all)
+                        if camera_name == self._active_camera and index == len(frames):
+                            self.update_camera_display(camera_name, frame, frame_info)
 
                         # Write to video if recording
-                        if file_manager.is_recording():
+                        if recording:
                             file_manager.write_video_frame(camera_name, frame)
 
                 # Maintain target FPS
-                elapsed = time.time() - loop_start
+                elapsed = time.perf_counter() - loop_start
                 sleep_time = max(0, frame_interval - elapsed)
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    self._stop_event.wait(sleep_time)
 
             except Exception as e:
-                print(f"Display loop error: {e}")
-                time.sleep(0.1)
+                self._report_error("loop", f"Display loop error: {e}")
+                self._stop_event.wait(0.1)
 
     def set_display_width(self, width: int):
         """Set display width for all cameras"""
@@ -478,15 +639,16 @@ class DisplayManager:
         )  # Clamp between reasonable values
 
     def get_current_fps(self) -> float:
-        """Get average display FPS across cameras"""
-        if not self._camera_current_fps:
-            return 0.0
-        try:
-            return sum(self._camera_current_fps.values()) / len(
-                self._camera_current_fps
-            )
-        except Exception:
-            return 0.0
+        """Get average display FPS across cameras shown in the last second"""
+        cutoff = time.perf_counter_ns() - 1_000_000_000
+        # Cameras on hidden tabs stop being rendered, so leave them out
+        # rather than averaging in their last known rate
+        rates = [
+            self._rolling_fps(times)
+            for times in list(self._frame_times.values())
+            if times and times[-1] >= cutoff
+        ]
+        return sum(rates) / len(rates) if rates else 0.0
 
     def take_screenshot(self, camera_name: str) -> Optional[np.ndarray]:
         """Take a screenshot of currently displayed frame"""
@@ -506,6 +668,7 @@ class DisplayManager:
                 text=f"Camera {camera_name}\nError: {error_message}", image=""
             )
             self.camera_frames[camera_name].image = None
+            self._photos.pop(camera_name, None)
 
     def show_no_signal(self, camera_name: str):
         """Show no signal message on camera display"""
@@ -514,6 +677,7 @@ class DisplayManager:
                 text=f"Camera {camera_name}\nNo Signal", image=""
             )
             self.camera_frames[camera_name].image = None
+            self._photos.pop(camera_name, None)
 
 
 class UIManager:
@@ -4,17 +4,45 @@ Lane Detection Controls UI Module
 Provides UI controls for lane detection settings
 """
 
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Any, Callable, Optional, TYPE_CHECKING
+from typing import Dict, Any, Callable, Optional, Tuple, TYPE_CHECKING
+import time
+
+from .tk_helpers import LabelTexts, run_once, suppress_events
+
+logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from lane_detection.lane_detector import LaneDetector
     from lane_detection.lane_visualizer import LaneVisualizer
 
 
+@run_once
+def _configure_status_styles():
+    """Register the running/stopped status label styles"""
+    style = ttk.Style()
+    style.configure("Running.TLabel", foreground="green")
+    style.configure("Stopped.TLabel", foreground="red")
+
+
 class LaneControlPanel:
     """Lane detection control panel"""
+
+    # Delay before a dragged slider's value is passed downstream
+    _SLIDER_DEBOUNCE_MS = 150
+    # Minimum spacing of live updates from a throttled slider
+    _SLIDER_THROTTLE_MS = 100
+    # Initial values, restored by Reset Settings
+    _DEFAULTS = {
+        "confidence": 0.5,
+        "thickness": 3,
+        "show_points": True,
+        "show_lines": True,
+        "show_filled": False,
+    }
+    _VIZ_KEYS = ("show_points", "show_lines", "show_filled")
     
     def __init__(self, parent: tk.Widget, lane_detector: "LaneDetector", 
                  lane_visualizer: "LaneVisualizer"):
@@ -22,11 +50,28 @@ class LaneControlPanel:
         self.lane_detector = lane_detector
         self.lane_visualizer = lane_visualizer
         self.widgets: Dict[str, Any] = {}
+        # Pending after() ids for debounced slider updates, by slider name
+        self._pending_after: Dict[str, str] = {}
+        # Throttled sliders: when each last fired, and the newest value waiting
+        self._last_fired: Dict[str, float] = {}
+        self._throttled_args: Dict[str, Tuple] = {}
+        self._viz_flush_id: Optional[str] = None
+        # Set while widgets are updated programmatically (see suppress_events)
+        self._suppress_events = False
+        # Slider value labels, configured only when their text changes
+        self._labels = LabelTexts(self.widgets)
+        # Running state the start/stop button and status label currently show
+        self._shown_running = False
+        # Values last passed to the detector/visualizer (they start at defaults)
+        self._applied: Dict[str, Any] = dict(self._DEFAULTS)
         
         # Callback functions
         self.on_lane_detection_changed: Optional[Callable] = None
-        
-        self.setup_lane_controls()
+
+        # The detector and visualizer already start at these defaults; don't
+        # push them back downstream when the scales are first set
+        with suppress_events(self):
+            self.setup_lane_controls()
     
     def setup_lane_controls(self):
         """Setup the lane detection control interface"""
@@ -60,11 +105,13 @@ class LaneControlPanel:
             from_=0.1,
             to=1.0,
             orient=tk.HORIZONTAL,
-            command=lambda val: self._on_confidence_change(float(val))
+            command=self._on_confidence_change
         )
-        self.widgets["confidence_scale"].set(0.5)  # Default value
+        self.widgets["confidence_scale"].set(self._DEFAULTS["confidence"])
         self.widgets["confidence_scale"].pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-        self.widgets["confidence_label"] = ttk.Label(confidence_control_frame, text="0.5", width=6)
+        self.widgets["confidence_label"] = ttk.Label(
+            confidence_control_frame, text=f"{self._DEFAULTS['confidence']:.1f}", width=6
+        )
         self.widgets["confidence_label"].pack(side=tk.RIGHT)
         
         # Visualization options frame
@@ -72,32 +119,32 @@ class LaneControlPanel:
         viz_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Show points toggle
-        self.widgets["show_points_var"] = tk.BooleanVar(value=True)
+        self.widgets["show_points_var"] = tk.BooleanVar(value=self._DEFAULTS["show_points"])
         points_check = ttk.Checkbutton(
             viz_frame,
             text="Show Lane Points",
             variable=self.widgets["show_points_var"],
-            command=self._on_viz_option_change
+            command=self._schedule_viz_flush
         )
         points_check.pack(side=tk.LEFT, padx=5)
         
         # Show lines toggle
-        self.widgets["show_lines_var"] = tk.BooleanVar(value=True)
+        self.widgets["show_lines_var"] = tk.BooleanVar(value=self._DEFAULTS["show_lines"])
         lines_check = ttk.Checkbutton(
             viz_frame,
             text="Show Lane Lines",
             variable=self.widgets["show_lines_var"],
-            command=self._on_viz_option_change
+            command=self._schedule_viz_flush
         )
         lines_check.pack(side=tk.LEFT, padx=5)
         
         # Show filled area toggle
-        self.widgets["show_filled_var"] = tk.BooleanVar(value=False)
+        self.widgets["show_filled_var"] = tk.BooleanVar(value=self._DEFAULTS["show_filled"])
         filled_check = ttk.Checkbutton(
             viz_frame,
             text="Show Filled Area",
             variable=self.widgets["show_filled_var"],
-            command=self._on_viz_option_change
+            command=self._schedule_viz_flush
         )
         filled_check.pack(side=tk.LEFT, padx=5)
         
@@ -113,11 +160,13 @@ class LaneControlPanel:
             from_=1,
             to=10,
             orient=tk.HORIZONTAL,
-            command=lambda val: self._on_thickness_change(int(float(val)))
+            command=self._on_thickness_change
         )
-        self.widgets["thickness_scale"].set(3)  # Default value
+        self.widgets["thickness_scale"].set(self._DEFAULTS["thickness"])
         self.widgets["thickness_scale"].pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-        self.widgets["thickness_label"] = ttk.Label(thickness_control_frame, text="3", width=6)
+        self.widgets["thickness_label"] = ttk.Label(
+            thickness_control_frame, text=str(self._DEFAULTS["thickness"]), width=6
+        )
         self.widgets["thickness_label"].pack(side=tk.RIGHT)
         
         # Action buttons frame
@@ -141,38 +190,101 @@ class LaneControlPanel:
         reset_btn.pack(side=tk.RIGHT)
         
         # Status label
-        self.widgets["status_label"] = ttk.Label(main_frame, text="Status: Stopped", 
-                                                foreground="red")
+        _configure_status_styles()
+        self.widgets["status_label"] = ttk.Label(
+            main_frame, text="Status: Stopped", style="Stopped.TLabel"
+        )
         self.widgets["status_label"].pack(fill=tk.X, pady=(10, 0))
     
     def _on_detection_toggle(self):
         """Handle detection enable/disable toggle"""
         enabled = self.widgets["detection_enabled_var"].get()
-        print(f"Lane detection {'enabled' if enabled else 'disabled'}")
+        logger.debug("Lane detection %s", "enabled" if enabled else "disabled")
         
         if self.on_lane_detection_changed:
             self.on_lane_detection_changed("detection_toggle", enabled)
     
-    def _on_confidence_change(self, value: float):
+    def _cancel_pending_updates(self):
+        """Drop slider and toggle updates that haven't been applied yet"""
+        for pending in self._pending_after.values():
+            self.parent.after_cancel(pending)
+        self._pending_after.clear()
+        self._throttled_args.clear()
+        if self._viz_flush_id is not None:
+            self.parent.after_cancel(self._viz_flush_id)
+            self._viz_flush_id = None
+
+    def _debounce(self, name: str, func: Callable, *args):
+        """Run func(*args) once the named slider has been still for a moment"""
+        pending = self._pending_after.get(name)
+        if pending is not None:
+            self.parent.after_cancel(pending)
+        self._pending_after[name] = self.parent.after(
+            self._SLIDER_DEBOUNCE_MS, self._run_debounced, name, func, *args
+        )
+
+    def _run_debounced(self, name: str, func: Callable, *args):
+        """Fire a debounced update and forget its pending id"""
+        self._pending_after.pop(name, None)
+        func(*args)
+
+    def _throttle(self, name: str, func: Callable, *args):
+        """Run func(*args) at most once per interval, ending on the newest args"""
+        self._throttled_args[name] = args
+        if name in self._pending_after:
+            return
+        interval = self._SLIDER_THROTTLE_MS / 1000
+        remaining = self._last_fired.get(name, 0.0) + interval - time.monotonic()
+        if remaining <= 0:
+            self._fire_throttled(name, func)
+        else:
+            self._pending_after[name] = self.parent.after(
+                int(remaining * 1000) + 1, self._fire_throttled, name, func
+            )
+
+    def _fire_throttled(self, name: str, func: Callable):
+        """Fire a throttled update with the newest value it was given"""
+        self._pending_after.pop(name, None)
+        self._last_fired[name] = time.monotonic()
+        func(*self._throttled_args.pop(name))
+
+    def _on_confidence_change(self, value: str):
         """Handle confidence threshold change"""
+        # ttk.Scale passes its new position as a float string
+        value = float(value)
         # Update label
-        if "confidence_label" in self.widgets:
-            self.widgets["confidence_label"].config(text=f"{value:.1f}")
-        
-        # Update detector
+        self._labels.set("confidence_label", f"{value:.1f}")
+        if self._suppress_events:
+            return
+        # Throttled rather than debounced so detections follow the drag live
+        self._throttle("confidence", self._apply_confidence, value)
+
+    def _apply_confidence(self, value: float):
+        """Pass a (throttled) confidence threshold to the detector"""
+        # Update detector; the status bar reports the value via the callback,
+        # so nothing is printed on this live drag path
         self.lane_detector.set_confidence_threshold(value)
-        
-        print(f"Lane detection confidence threshold: {value:.1f}")
-        
+
         if self.on_lane_detection_changed:
             self.on_lane_detection_changed("confidence", value)
     
+    def _schedule_viz_flush(self):
+        """Apply visualization toggles once the current events are handled"""
+        if self._viz_flush_id is None:
+            self._viz_flush_id = self.parent.after_idle(self._on_viz_option_change)
+
     def _on_viz_option_change(self):
         """Handle visualization option changes"""
+        self._viz_flush_id = None
         show_points = self.widgets["show_points_var"].get()
         show_lines = self.widgets["show_lines_var"].get()
         show_filled = self.widgets["show_filled_var"].get()
-        
+        viz = (show_points, show_lines, show_filled)
+        if viz == tuple(self._applied[key] for key in self._VIZ_KEYS):
+            # Toggled and toggled back before the flush; nothing changed
+            return
+        self._applied.update(zip(self._VIZ_KEYS, viz))
+
         # Update visualizer
         self.lane_visualizer.set_visualization_options(
             show_points=show_points,
@@ -180,7 +292,12 @@ class LaneControlPanel:
             show_filled_area=show_filled
         )
         
-        print(f"Visualization options: points={show_points}, lines={show_lines}, filled={show_filled}")
+        logger.debug(
+            "Visualization options: points=%s, lines=%s, filled=%s",
+            show_points,
+            show_lines,
+            show_filled,
+        )
         
         if self.on_lane_detection_changed:
             self.on_lane_detection_changed("visualization", {
@@ -189,16 +306,25 @@ class LaneControlPanel:
                 "show_filled": show_filled
             })
     
-    def _on_thickness_change(self, thickness: int):
+    def _on_thickness_change(self, value: str):
         """Handle line thickness change"""
+        thickness = int(float(value))
         # Update label
-        if "thickness_label" in self.widgets:
-            self.widgets["thickness_label"].config(text=str(thickness))
-        
+        self._labels.set("thickness_label", str(thickness))
+        if self._suppress_events:
+            return
+        self._debounce("thickness", self._apply_thickness, thickness)
+
+    def _apply_thickness(self, thickness: int):
+        """Pass a settled line thickness to the visualizer"""
+        if thickness == self._applied["thickness"]:
+            # Dragged back to where it started
+            return
+        self._applied["thickness"] = thickness
         # Update visualizer
         self.lane_visualizer.set_line_thickness(thickness)
         
-        print(f"Lane line thickness: {thickness}")
+        logger.debug("Lane line thickness: %d", thickness)
         
         if self.on_lane_detection_changed:
             self.on_lane_detection_changed("thickness", thickness)
@@ -208,41 +334,44 @@ class LaneControlPanel:
         if self.lane_detector.is_running():
             # Stop detection
             self.lane_detector.stop_detection()
-            self.widgets["start_stop_btn"].config(text="Start Detection")
-            self.widgets["status_label"].config(text="Status: Stopped", foreground="red")
-            print("Lane detection stopped")
+            self.update_status(False)
+            logger.debug("Lane detection stopped")
         else:
             # Start detection
             if self.lane_detector.start_detection():
-                self.widgets["start_stop_btn"].config(text="Stop Detection")
-                self.widgets["status_label"].config(text="Status: Running", foreground="green")
-                print("Lane detection started")
+                self.update_status(True)
+                logger.debug("Lane detection started")
             else:
                 messagebox.showerror("Error", "Failed to start lane detection")
     
     def _on_reset_settings(self):
         """Reset all settings to defaults"""
-        if messagebox.askyesno("Reset Settings", "Reset all lane detection settings to defaults?"):
-            # Reset confidence threshold
-            self.widgets["confidence_scale"].set(0.5)
-            self.widgets["confidence_label"].config(text="0.5")
-            self.lane_detector.set_confidence_threshold(0.5)
-            
-            # Reset visualization options
-            self.widgets["show_points_var"].set(True)
-            self.widgets["show_lines_var"].set(True)
-            self.widgets["show_filled_var"].set(False)
-            self.lane_visualizer.set_visualization_options(True, True, False)
-            
-            # Reset line thickness
-            self.widgets["thickness_scale"].set(3)
-            self.widgets["thickness_label"].config(text="3")
-            self.lane_visualizer.set_line_thickness(3)
-            
-            print("Lane detection settings reset to defaults")
-            
-            if self.on_lane_detection_changed:
-                self.on_lane_detection_changed("reset", None)
+        if not messagebox.askyesno("Reset Settings", "Reset all lane detection settings to defaults?"):
+            return
+
+        # Setting the scales fires their commands; keep those to label updates
+        # and apply the defaults downstream once afterwards
+        defaults = self._DEFAULTS
+        self._cancel_pending_updates()
+        with suppress_events(self):
+            self.widgets["confidence_scale"].set(defaults["confidence"])
+            self._labels.set("confidence_label", f"{defaults['confidence']:.1f}")
+            self.widgets["thickness_scale"].set(defaults["thickness"])
+            self._labels.set("thickness_label", str(defaults["thickness"]))
+            for key in self._VIZ_KEYS:
+                self.widgets[f"{key}_var"].set(defaults[key])
+
+        self._applied.update(defaults)
+        self.lane_detector.set_confidence_threshold(defaults["confidence"])
+        self.lane_visualizer.set_visualization_options(
+            *(defaults[key] for key in self._VIZ_KEYS)
+        )
+        self.lane_visualizer.set_line_thickness(defaults["thickness"])
+
+        logger.debug("Lane detection settings reset to defaults")
+
+        if self.on_lane_detection_changed:
+            self.on_lane_detection_changed("reset", None)
     
     def set_lane_detection_callback(self, callback: Callable):
         """Set callback for lane detection changes"""
@@ -250,9 +379,12 @@ class LaneControlPanel:
     
     def update_status(self, is_running: bool):
         """Update status display"""
+        if is_running == self._shown_running:
+            return
+        self._shown_running = is_running
         if is_running:
             self.widgets["start_stop_btn"].config(text="Stop Detection")
-            self.widgets["status_label"].config(text="Status: Running", foreground="green")
+            self.widgets["status_label"].config(text="Status: Running", style="Running.TLabel")
         else:
             self.widgets["start_stop_btn"].config(text="Start Detection")
-            self.widgets["status_label"].config(text="Status: Stopped", foreground="red")
+            self.widgets["status_label"].config(text="Status: Stopped", style="Stopped.TLabel")
@@ -4,11 +4,18 @@ ROI Controls UI Module
 Provides UI controls for ROI (Region of Interest) settings
 """
 
+import logging
 import tkinter as tk
+from dataclasses import replace
+from functools import partial
 from tkinter import ttk, messagebox
 from typing import Dict, Any, Callable, Optional, TYPE_CHECKING
 import numpy as np
 
+from .tk_helpers import LabelTexts, unbind
+
+logger = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     from camera.roi_manager import ROIManager, ROISettings
 
@@ -21,14 +28,27 @@ class ROIControlPanel:
         self.roi_manager = roi_manager
         self.widgets: Dict[str, Any] = {}
         self.camera_tabs: Dict[str, ttk.Frame] = {}
+        # Value labels, configured only when their text changes
+        self._labels = LabelTexts(self.widgets)
         
         # Callback functions
         self.on_roi_changed: Optional[Callable] = None
-        
+
+        # The controls are built the first time the ROI tab is shown
+        self._controls_built = False
+        self._map_binding = self.parent.bind("<Map>", self._on_first_map, add="+")
+
+    def _on_first_map(self, event=None):
+        """Build the controls when the panel is first shown"""
+        unbind(self.parent, "<Map>", self._map_binding)
         self.setup_roi_controls()
 
     def setup_roi_controls(self):
         """Setup the ROI control interface"""
+        if self._controls_built:
+            return
+        self._controls_built = True
+
         # Main ROI control frame
         main_frame = ttk.LabelFrame(self.parent, text="ROI Controls", padding=10)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -38,7 +58,9 @@ class ROIControlPanel:
         global_frame.pack(fill=tk.X, pady=(0, 10))
 
         # Overlay visibility toggle
-        self.widgets["overlay_var"] = tk.BooleanVar(value=True)
+        self.widgets["overlay_var"] = tk.BooleanVar(
+            value=self.roi_manager.show_roi_overlay
+        )
         overlay_check = ttk.Checkbutton(
             global_frame,
             text="Show ROI Overlay",
@@ -48,7 +70,9 @@ class ROIControlPanel:
         overlay_check.pack(side=tk.LEFT, padx=5)
 
         # Mouse ROI selection toggle
-        self.widgets["mouse_roi_var"] = tk.BooleanVar(value=False)
+        self.widgets["mouse_roi_var"] = tk.BooleanVar(
+            value=self.roi_manager.is_mouse_roi_enabled()
+        )
         mouse_roi_check = ttk.Checkbutton(
             global_frame,
             text="Enable Mouse ROI Selection",
@@ -105,7 +129,7 @@ class ROIControlPanel:
             from_=-9,
             to=9,
             orient=tk.HORIZONTAL,
-            command=lambda val: self._on_exposure_change("CAM_A", int(float(val)))
+            command=partial(self._on_exposure_change, "CAM_A"),
         )
         self.widgets["CAM_A_exposure_scale"].pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         self.widgets["CAM_A_exposure_label"] = ttk.Label(exposure_control_frame, text="0", width=6)
@@ -144,16 +168,28 @@ class ROIControlPanel:
 
     def _update_controls_from_settings(self, camera_name: str):
         """Update UI controls from current ROI settings"""
+        if not self._controls_built:
+            # They'll be initialized from the settings when first built
+            return
         roi_settings = self.roi_manager.get_roi_settings(camera_name)
         if not roi_settings:
             return
 
+        # Only touch widgets whose value differs; Scale.set also runs the
+        # scale's command, so an unchanged set would still cost a callback
+
         # Update checkboxes (only focus region since enable is handled by mouse)
-        self.widgets[f"{camera_name}_focus_var"].set(roi_settings.focus_region)
+        focus_var = self.widgets[f"{camera_name}_focus_var"]
+        if focus_var.get() != roi_settings.focus_region:
+            focus_var.set(roi_settings.focus_region)
 
         # Update scales and labels
-        self.widgets[f"{camera_name}_exposure_scale"].set(roi_settings.exposure_compensation)
-        self.widgets[f"{camera_name}_exposure_label"].config(text=f"{roi_settings.exposure_compensation:+d}")
+        exposure_scale = self.widgets[f"{camera_name}_exposure_scale"]
+        if float(exposure_scale.get()) != roi_settings.exposure_compensation:
+            exposure_scale.set(roi_settings.exposure_compensation)
+        self._labels.set(
+            f"{camera_name}_exposure_label", f"{roi_settings.exposure_compensation:+d}"
+        )
 
     def _on_overlay_toggle(self):
         """Handle overlay visibility toggle"""
@@ -170,7 +206,12 @@ class ROIControlPanel:
     def _on_roi_enabled(self, camera_name: str):
         """Handle ROI enable/disable - apply immediately"""
         enabled = self.widgets[f"{camera_name}_enabled_var"].get()
-        print(f"UI: ROI {'enabled' if enabled else 'disabled'} for {camera_name}")
+        current = self.roi_manager.get_roi_settings(camera_name)
+        if current is not None and current.enabled == enabled:
+            return
+        logger.debug(
+            "ROI %s for %s", "enabled" if enabled else "disabled", camera_name
+        )
         self.roi_manager.enable_roi(camera_name, enabled)
         if self.on_roi_changed:
             self.on_roi_changed(camera_name)
@@ -178,37 +219,55 @@ class ROIControlPanel:
     def _on_focus_toggle(self, camera_name: str):
         """Handle focus region toggle - apply immediately"""
         enabled = self.widgets[f"{camera_name}_focus_var"].get()
-        print(f"UI: ROI focus region {'enabled' if enabled else 'disabled'} for {camera_name}")
+        current = self.roi_manager.get_roi_settings(camera_name)
+        if current is not None and current.focus_region == enabled:
+            return
+        logger.debug(
+            "ROI focus region %s for %s",
+            "enabled" if enabled else "disabled",
+            camera_name,
+        )
         self.roi_manager.set_focus_region(camera_name, enabled)
         if self.on_roi_changed:
             self.on_roi_changed(camera_name)
 
-    def _on_exposure_change(self, camera_name: str, value: int):
+    def _on_exposure_change(self, camera_name: str, value: str):
         """Handle exposure compensation change (update UI only, don't apply to camera)"""
+        # ttk.Scale passes its new position as a float string
+        value = int(float(value))
         # Update UI label only
-        self.widgets[f"{camera_name}_exposure_label"].config(text=f"{value:+d}")
+        self._labels.set(f"{camera_name}_exposure_label", f"{value:+d}")
 
     def _on_apply_roi(self, camera_name: str):
         """Apply ROI settings to camera"""
         # Get current UI values
         exposure = int(self.widgets[f"{camera_name}_exposure_scale"].get())
         focus_region = self.widgets[f"{camera_name}_focus_var"].get()
-        
-        print(f"UI: Applying ROI settings for {camera_name}: exp={exposure:+d}, focus={focus_region}")
-        
-        # Apply all settings to ROI manager
-        self.roi_manager.set_exposure_compensation(camera_name, exposure)
-        self.roi_manager.set_focus_region(camera_name, focus_region)
-        
+
+        # Hand the manager the whole change at once; it resends the camera
+        # control and notifies listeners only if something differs
+        current = self.roi_manager.get_roi_settings(camera_name)
+        if current is None:
+            return
+        new = replace(current, exposure_compensation=exposure, focus_region=focus_region)
+        if not self.roi_manager.apply_settings(camera_name, new):
+            logger.debug("ROI settings for %s unchanged", camera_name)
+            return
+
         # Show feedback
-        print(f"UI: ROI settings applied for {camera_name}: exp={exposure:+d}, focus={focus_region}")
+        logger.debug(
+            "ROI settings applied for %s: exp=%+d, focus=%s",
+            camera_name,
+            exposure,
+            focus_region,
+        )
         
         if self.on_roi_changed:
             self.on_roi_changed(camera_name)
 
     def _on_reset_camera(self, camera_name: str):
         """Reset ROI settings for a specific camera"""
-        print(f"UI: Resetting ROI settings for {camera_name}")
+        logger.debug("Resetting ROI settings for %s", camera_name)
         self.roi_manager.reset_roi_settings(camera_name)
         self._update_controls_from_settings(camera_name)
         if self.on_roi_changed:
@@ -217,7 +276,7 @@ class ROIControlPanel:
     def _on_reset_all(self):
         """Reset all ROI settings"""
         if messagebox.askyesno("Reset ROI", "Reset all ROI settings to defaults?"):
-            print("UI: Resetting all ROI settings")
+            logger.debug("Resetting all ROI settings")
             self.roi_manager.reset_all_roi_settings()
             self._update_controls_from_settings("CAM_A")
             if self.on_roi_changed:
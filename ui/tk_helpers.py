@@ -0,0 +1,69 @@
+"""
+Small Tk helpers shared by the UI panels
+"""
+
+import tkinter as tk
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def unbind(widget: tk.Misc, sequence: str, funcid: str):
+    """Remove one add="+" binding, leaving the other handlers in place"""
+    # Misc.unbind(sequence, funcid) drops every handler for the sequence
+    # before Python 3.13, so strip just this funcid from the bound script
+    script = widget.bind(sequence)
+    widget.bind(
+        sequence, "\n".join(line for line in script.split("\n") if funcid not in line)
+    )
+    widget.deletecommand(funcid)
+
+
+def run_once(func: Callable[[], None]) -> Callable[[], None]:
+    """Make a setup function (e.g. ttk style registration) run on its first call only"""
+    done = False
+
+    @wraps(func)
+    def wrapper():
+        nonlocal done
+        if not done:
+            done = True
+            func()
+
+    return wrapper
+
+
+@contextmanager
+def suppress_events(owner: Any, flush: Optional[tk.Misc] = None):
+    """Set owner._suppress_events while widgets are updated in bulk
+
+    Change handlers check the flag to skip pushing values downstream. If
+    flush is given, one idle-task pass runs when the outermost block exits.
+    """
+    previous = owner._suppress_events
+    owner._suppress_events = True
+    try:
+        yield
+    finally:
+        owner._suppress_events = previous
+        if flush is not None and not previous:
+            flush.update_idletasks()
+
+
+class LabelTexts:
+    """Configures labels in a widgets dict only when their text or colour changes"""
+
+    def __init__(self, widgets: Dict[str, Any]):
+        self._widgets = widgets
+        self._shown: Dict[str, Tuple[str, Optional[str]]] = {}
+
+    def set(self, key: str, text: str, foreground: Optional[str] = None):
+        """Show text (and optionally a foreground colour) on the label at key"""
+        label = self._widgets.get(key)
+        if label is None or self._shown.get(key) == (text, foreground):
+            return
+        options = {"text": text}
+        if foreground is not None:
+            options["foreground"] = foreground
+        label.config(**options)
+        self._shown[key] = (text, foreground)
@@ -1,29 +1,75 @@
 import cv2
 import numpy as np
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+
+# Supported video codecs and the container each one is written to
+_VIDEO_CODECS = {
+    "MJPG": cv2.VideoWriter_fourcc(*"MJPG"),
+    "XVID": cv2.VideoWriter_fourcc(*"XVID"),
+    "MP4V": cv2.VideoWriter_fourcc(*"mp4v"),
+    "H264": cv2.VideoWriter_fourcc(*"H264"),
+}
+_CODEC_EXTENSIONS = {"MJPG": "avi", "XVID": "avi", "MP4V": "mp4", "H264": "mp4"}
 
 
 class FileManager:
     """Handles file operations for capturing images and videos"""
 
-    def __init__(self, save_directory: Optional[Path] = None):
+    # Frames buffered per camera while the encoder catches up
+    _FRAME_QUEUE_SIZE = 8
+    # Image encoder threads for batch captures (one per OAK camera)
+    _CAPTURE_WORKERS = 3
+    # Seconds a disk usage reading is reused by get_available_space
+    _SPACE_CACHE_TTL = 2.0
+
+    def __init__(
+        self,
+        save_directory: Optional[Path] = None,
+        worker_cores: Optional[Set[int]] = None,
+    ):
         self.save_directory = save_directory or Path.cwd() / "captures"
         self.save_directory.mkdir(exist_ok=True)
+        # CPU cores the encoder/writer threads are pinned to (Linux only);
+        # by default every core but 0, which is left to the Tk thread
+        if worker_cores is None:
+            worker_cores = self._default_worker_cores()
+        self.worker_cores = worker_cores
         self.video_writers: Dict[str, cv2.VideoWriter] = {}
+        self.video_filenames: Dict[str, str] = {}
+        # Encoding runs on one thread per camera, fed through a bounded queue
+        self._frame_queues: Dict[str, queue.Queue] = {}
+        self._writer_threads: Dict[str, threading.Thread] = {}
+        self._dropped_frames: Dict[str, int] = {}
+        # Created on first batch capture; cv2.imwrite releases the GIL
+        self._capture_pool: Optional[ThreadPoolExecutor] = None
+        # Date directories already created under save_directory
+        self._known_dirs: Set[Path] = set()
+        # Last capture timestamp handed out and how often it was repeated
+        self._last_timestamp = ""
+        self._timestamp_repeats = 0
         self.recording = False
         self.recording_start_time: Optional[datetime] = None
+        # Last disk usage reading (free_gb, total_gb) and when it was taken
+        self._space_cache: Optional[Tuple[float, float]] = None
+        self._space_checked = 0.0
 
         # Supported image formats
         self.image_formats = [".jpg", ".png", ".bmp", ".tiff"]
+        # Lowercase suffixes recognised when listing captured files
+        self._image_suffixes = frozenset(
+            [".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif"]
+        )
+        self._video_suffixes = frozenset([".avi", ".mp4", ".mov", ".mkv"])
         # Supported video codecs
-        self.video_codecs = {
-            "MJPG": cv2.VideoWriter_fourcc(*"MJPG"),
-            "XVID": cv2.VideoWriter_fourcc(*"XVID"),
-            "MP4V": cv2.VideoWriter_fourcc(*"mp4v"),
-            "H264": cv2.VideoWriter_fourcc(*"H264"),
-        }
+        self.video_codecs = dict(_VIDEO_CODECS)
         self.current_codec = "MJPG"
 
     def set_save_directory(self, directory: Path) -> bool:
@@ -31,6 +77,8 @@ class FileManager:
         try:
             self.save_directory = directory
             self.save_directory.mkdir(exist_ok=True)
+            self._known_dirs.clear()
+            self._space_cache = None
             return True
         except Exception as e:
             print(f"Save directory error: {e}")
@@ -51,7 +99,7 @@ class FileManager:
         image: np.ndarray,
         format: str = "jpg",
         custom_filename: Optional[str] = None,
-    ) -> tuple[bool, str]:
+    ) -> Tuple[bool, str]:
         """
         Capture and save an image
         Returns: (success: bool, filepath: str)
@@ -60,52 +108,125 @@ class FileManager:
             if custom_filename:
                 filename = self.save_directory / f"{custom_filename}.{format}"
             else:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[
-                    :-3
-                ]  # Include milliseconds
+                timestamp = self._make_timestamp()
                 filename = self.save_directory / f"{camera_name}_{timestamp}.{format}"
 
             success = cv2.imwrite(str(filename), image)
+            self._space_cache = None
             return success, str(filename) if success else ""
 
         except Exception as e:
             print(f"Image capture error: {e}")
             return False, ""
 
+    def _make_timestamp(self, now: Optional[datetime] = None) -> str:
+        """Millisecond capture timestamp, suffixed if already used that millisecond"""
+        timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        if timestamp != self._last_timestamp:
+            self._last_timestamp = timestamp
+            self._timestamp_repeats = 0
+            return timestamp
+        # Same millisecond as the previous capture: keep the files apart
+        self._timestamp_repeats += 1
+        return f"{timestamp}_{self._timestamp_repeats}"
+
     def capture_images_batch(
         self, images: Dict[str, np.ndarray], format: str = "jpg"
-    ) -> tuple[int, List[str]]:
+    ) -> Tuple[int, List[str]]:
         """
         Capture multiple images with synchronized timestamp
         Returns: (success_count: int, filepaths: List[str])
         """
+        date_dir, jobs = self._submit_batch(images, format)
+        return self._collect_batch(date_dir, jobs)
+
+    def capture_images_batch_async(
+        self,
+        images: Dict[str, np.ndarray],
+        on_done: Callable[[int, List[str]], None],
+        format: str = "jpg",
+    ):
+        """
+        Like capture_images_batch, but returns once the writes are queued.
+        on_done(success_count, filepaths) runs on a capture thread after the
+        last write finishes; Tk callers must hand results back with root.after.
+        The images must not be modified afterwards.
+        """
+        date_dir, jobs = self._submit_batch(images, format)
+        if not jobs:
+            on_done(0, [])
+            return
+
+        remaining = [len(jobs)]
+        lock = threading.Lock()
+
+        def job_finished(_job):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            on_done(*self._collect_batch(date_dir, jobs))
+
+        for _, _, job in jobs:
+            job.add_done_callback(job_finished)
+
+    def _submit_batch(
+        self, images: Dict[str, np.ndarray], format: str
+    ) -> Tuple[Path, List[Tuple[str, str, Future]]]:
+        """Queue one image write per camera on the capture pool"""
         now = datetime.now()
-        timestamp = now.strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        timestamp = self._make_timestamp(now)
         # Date-based directory
-        date_dir = self.save_directory / now.strftime("%Y-%m-%d")
         try:
-            date_dir.mkdir(parents=True, exist_ok=True)
+            date_dir = self.ensure_date_directory(now)
         except Exception as e:
             print(f"Date dir error: {e}")
             date_dir = self.save_directory
-        filepaths = []
-        success_count = 0
 
+        # Encode and write all cameras in parallel
+        if self._capture_pool is None:
+            self._capture_pool = ThreadPoolExecutor(
+                max_workers=self._CAPTURE_WORKERS,
+                thread_name_prefix="capture",
+                initializer=self._pin_worker_thread,
+            )
+        # Every camera shares the directory and timestamp, so build the
+        # path pieces once rather than a Path per camera
+        prefix = f"{date_dir}{os.sep}"
+        suffix = f"_{timestamp}.{format}"
+        jobs = []
         for camera_name, image in images.items():
+            filename = prefix + camera_name + suffix
+            job = self._capture_pool.submit(cv2.imwrite, filename, image)
+            jobs.append((camera_name, filename, job))
+        return date_dir, jobs
+
+    def _collect_batch(
+        self, date_dir: Path, jobs: List[Tuple[str, str, Future]]
+    ) -> Tuple[int, List[str]]:
+        """Wait for a batch's writes and gather the saved paths in camera order"""
+        filepaths = []
+        success_count = 0
+        for camera_name, filename, job in jobs:
             try:
-                filename = date_dir / f"{camera_name}_{timestamp}.{format}"
-                if cv2.imwrite(str(filename), image):
-                    filepaths.append(str(filename))
+                if job.result():
+                    filepaths.append(filename)
                     success_count += 1
             except Exception as e:
                 print(f"Batch capture error for {camera_name}: {e}")
 
+        if success_count < len(jobs):
+            # The directory may have been removed behind our back
+            self._known_dirs.discard(date_dir)
+        self._space_cache = None
         return success_count, filepaths
 
     def ensure_date_directory(self, dt: Optional[datetime] = None) -> Path:
         dt = dt or datetime.now()
         date_dir = self.save_directory / dt.strftime("%Y-%m-%d")
-        date_dir.mkdir(parents=True, exist_ok=True)
+        if date_dir not in self._known_dirs:
+            date_dir.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(date_dir)
         return date_dir
 
     def start_video_recording(
@@ -115,8 +236,8 @@ class FileManager:
         height: int,
         fps: int,
         codec: Optional[str] = None,
-        per_camera_resolutions: Optional[Dict[str, tuple[int, int]]] = None,
-    ) -> tuple[bool, str]:
+        per_camera_resolutions: Optional[Dict[str, Tuple[int, int]]] = None,
+    ) -> Tuple[bool, str]:
         """
         Start video recording for specified cameras
         Returns: (success: bool, message: str)
@@ -127,10 +248,10 @@ class FileManager:
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             codec_name = codec or self.current_codec
-            fourcc = self.video_codecs.get(codec_name, self.video_codecs["MJPG"])
-
-            # Determine file extension based on codec
-            extension = "avi" if codec_name in ["MJPG", "XVID"] else "mp4"
+            if codec_name not in self.video_codecs:
+                codec_name = "MJPG"
+            fourcc = self.video_codecs[codec_name]
+            extension = _CODEC_EXTENSIONS[codec_name]
 
             for camera_name in camera_names:
                 # Resolve per-camera frame size
@@ -148,9 +269,23 @@ class FileManager:
                     for w in self.video_writers.values():
                         w.release()
                     self.video_writers.clear()
+                    self.video_filenames.clear()
                     return False, f"Failed to create video writer for {camera_name}"
 
                 self.video_writers[camera_name] = writer
+                self.video_filenames[camera_name] = str(filename)
+
+            for camera_name, writer in self.video_writers.items():
+                frames = queue.Queue(maxsize=self._FRAME_QUEUE_SIZE)
+                thread = threading.Thread(
+                    target=self._writer_loop,
+                    args=(camera_name, writer, frames),
+                    daemon=True,
+                )
+                self._frame_queues[camera_name] = frames
+                self._writer_threads[camera_name] = thread
+                self._dropped_frames[camera_name] = 0
+                thread.start()
 
             self.recording = True
             self.recording_start_time = datetime.now()
@@ -160,18 +295,74 @@ class FileManager:
             return False, f"Failed to start recording: {str(e)}"
 
     def write_video_frame(self, camera_name: str, frame: np.ndarray) -> bool:
-        """Write frame to video file"""
-        if not self.recording or camera_name not in self.video_writers:
+        """Queue a frame for the camera's encoder thread
+
+        The frame must not be modified afterwards. If the encoder has fallen
+        behind, the oldest queued frame is dropped to keep latency bounded.
+        """
+        frames = self._frame_queues.get(camera_name)
+        if not self.recording or frames is None:
             return False
 
         try:
-            self.video_writers[camera_name].write(frame)
-            return True
-        except Exception as e:
-            print(f"Video frame write error for {camera_name}: {e}")
-            return False
+            frames.put_nowait(frame)
+        except queue.Full:
+            try:
+                frames.get_nowait()
+                # stop_video_recording may clear the counts concurrently
+                self._dropped_frames[camera_name] = (
+                    self._dropped_frames.get(camera_name, 0) + 1
+                )
+            except queue.Empty:
+                pass
+            try:
+                frames.put_nowait(frame)
+            except queue.Full:
+                return False
+        return True
+
+    def _writer_loop(
+        self, camera_name: str, writer: cv2.VideoWriter, frames: queue.Queue
+    ):
+        """Encode queued frames until the stop sentinel (None) arrives"""
+        # A failing writer usually fails on every frame; report the first
+        # error and a total at the end rather than one line per frame
+        errors = 0
+        self._pin_worker_thread()
+        while True:
+            frame = frames.get()
+            if frame is None:
+                break
+            try:
+                writer.write(frame)
+            except Exception as e:
+                errors += 1
+                if errors == 1:
+                    print(f"Video frame write error for {camera_name}: {e}")
+        if errors > 1:
+            print(f"Video frame write errors for {camera_name}: {errors} frames")
+
+    @staticmethod
+    def _default_worker_cores() -> Optional[Set[int]]:
+        """Usable cores minus core 0, or None where that leaves nothing to pin"""
+        if not hasattr(os, "sched_getaffinity"):
+            return None
+        cores = os.sched_getaffinity(0)
+        if len(cores) <= 1 or 0 not in cores:
+            return None
+        return cores - {0}
+
+    def _pin_worker_thread(self):
+        """Restrict the calling worker thread to worker_cores, if set"""
+        if not self.worker_cores:
+            return
+        try:
+            # On Linux, pid 0 applies to the calling thread only
+            os.sched_setaffinity(0, self.worker_cores)
+        except (AttributeError, OSError, ValueError) as e:
+            print(f"Worker CPU affinity error: {e}")
 
-    def stop_video_recording(self) -> tuple[bool, str, List[str]]:
+    def stop_video_recording(self) -> Tuple[bool, str, List[str]]:
         """
         Stop video recording
         Returns: (success: bool, message: str, filepaths: List[str])
@@ -181,33 +372,36 @@ class FileManager:
 
         filepaths = []
         try:
+            # Stop accepting frames, then let each encoder finish its queue
+            self.recording = False
+            for frames in self._frame_queues.values():
+                frames.put(None)
+            for thread in self._writer_threads.values():
+                thread.join()
+            self._frame_queues.clear()
+            self._writer_threads.clear()
+            dropped = sum(self._dropped_frames.values())
+            self._dropped_frames.clear()
+
             # Release all video writers and collect filenames
             for camera_name, writer in self.video_writers.items():
-                # Try to get the filename from the writer (not directly available)
-                # We'll reconstruct it from our naming convention
-                timestamp = (
-                    self.recording_start_time.strftime("%Y%m%d_%H%M%S")
-                    if self.recording_start_time
-                    else "unknown"
-                )
-                extension = "avi" if self.current_codec in ["MJPG", "XVID"] else "mp4"
-                filepath = (
-                    self.save_directory / f"{camera_name}_video_{timestamp}.{extension}"
-                )
-                filepaths.append(str(filepath))
-
                 writer.release()
+                filepaths.append(self.video_filenames[camera_name])
 
             self.video_writers.clear()
-            self.recording = False
-            self.recording_start_time = None
-
+            self.video_filenames.clear()
+            self._space_cache = None
             duration = (
                 (datetime.now() - self.recording_start_time).total_seconds()
                 if self.recording_start_time
                 else 0
             )
-            return True, f"Recording stopped. Duration: {duration:.1f}s", filepaths
+            self.recording_start_time = None
+
+            message = f"Recording stopped. Duration: {duration:.1f}s"
+            if dropped:
+                message += f" ({dropped} frames dropped)"
+            return True, message, filepaths
 
         except Exception as e:
             return False, f"Error stopping recording: {str(e)}", filepaths
@@ -226,17 +420,29 @@ class FileManager:
         """Cleanup resources"""
         if self.recording:
             self.stop_video_recording()
+        if self._capture_pool is not None:
+            self._capture_pool.shutdown(wait=True)
+            self._capture_pool = None
 
-    def get_available_space(self) -> tuple[float, float]:
+    def get_available_space(self) -> Tuple[float, float]:
         """
-        Get available disk space in GB
+        Get available disk space in GB, reusing a reading taken in the last
+        _SPACE_CACHE_TTL seconds. Writes made by this manager drop the cache.
         Returns: (free_space_gb: float, total_space_gb: float)
         """
+        now = time.monotonic()
+        cached = self._space_cache
+        if cached is not None and now - self._space_checked < self._SPACE_CACHE_TTL:
+            return cached
+
         try:
             import shutil
 
             total, used, free = shutil.disk_usage(self.save_directory)
-            return free / (1024**3), total / (1024**3)
+            space = (free / (1024**3), total / (1024**3))
+            self._space_cache = space
+            self._space_checked = now
+            return space
         except Exception as e:
             print(f"Disk space check error: {e}")
             return 0.0, 0.0
@@ -247,16 +453,25 @@ class FileManager:
         file_type: 'images', 'videos', or 'all'
         """
         try:
-            files = []
-            if file_type in ["images", "all"]:
-                for ext in self.image_formats:
-                    files.extend(self.save_directory.glob(f"*{ext}"))
-
-            if file_type in ["videos", "all"]:
-                for ext in [".avi", ".mp4", ".mov"]:
-                    files.extend(self.save_directory.glob(f"*{ext}"))
-
-            return sorted(files, key=lambda x: x.stat().st_mtime, reverse=True)
+            if file_type == "images":
+                suffixes = self._image_suffixes
+            elif file_type == "videos":
+                suffixes = self._video_suffixes
+            elif file_type == "all":
+                suffixes = self._image_suffixes | self._video_suffixes
+            else:
+                return []
+
+            # One directory pass; the mtime comes from the same entry stat
+            entries = []
+            with os.scandir(self.save_directory) as it:
+                for entry in it:
+                    suffix = os.path.splitext(entry.name)[1].lower()
+                    if suffix in suffixes and entry.is_file():
+                        entries.append((entry.stat().st_mtime, Path(entry.path)))
+
+            entries.sort(key=lambda item: item[0], reverse=True)
+            return [path for _, path in entries]
 
         except Exception as e:
             print(f"File listing error: {e}")